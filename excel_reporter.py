@@ -6,24 +6,103 @@ from analyzed Valgrind memory issues data.
 """
 
 import os
+from datetime import datetime, timezone
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Literal, Sequence, Union
 import logging
+from collections import Counter, defaultdict
+from zipfile import ZipFile, ZIP_DEFLATED
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import Cell, WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle, DEFAULT_FONT
     from openpyxl.utils import get_column_letter
     from openpyxl.worksheet.worksheet import Worksheet
+    from openpyxl.writer.excel import ExcelWriter
 except ImportError as e:
     raise ImportError(
         "openpyxl is required for Excel report generation. "
         "Install it with: pip install openpyxl"
     ) from e
 
+try:
+    import xlsxwriter
+except ImportError:  # Optional backend, see ExcelReporter(backend="xlsxwriter")
+    xlsxwriter = None
+
 from models import ClassifiedIssues, Statistics, MemoryIssue, IssueType, IssueSeverity
 
 
+# Per-type metadata used by the report loops, computed once at import time
+_CRITICAL_TYPES = frozenset({
+    IssueType.DEFINITELY_LOST,
+    IssueType.INVALID_READ,
+    IssueType.INVALID_WRITE,
+    IssueType.USE_AFTER_FREE,
+})
+_TYPE_DISPLAY = {t: t.value.replace("_", " ").title() for t in IssueType}
+_TYPE_ORDER = {t: i for i, t in enumerate(IssueType)}
+
+# Column letters indexed by 1-based column number (reports span far fewer than 26 columns)
+_COL_LETTERS = ("",) + tuple(get_column_letter(i) for i in range(1, 27))
+_FILL_FOR_TYPE = {t: "critical" for t in _CRITICAL_TYPES} | {IssueType.POSSIBLY_LOST: "high"}
+
+# User-friendly sheet names for each issue type
+_SHEET_NAMES = {
+    IssueType.DEFINITELY_LOST: "Definitely Lost",
+    IssueType.POSSIBLY_LOST: "Possibly Lost",
+    IssueType.STILL_REACHABLE: "Still Reachable",
+    IssueType.INVALID_READ: "Invalid Reads",
+    IssueType.INVALID_WRITE: "Invalid Writes",
+    IssueType.USE_AFTER_FREE: "Use After Free",
+    IssueType.OTHER: "Other Issues",
+}
+
+# Column headers of the per-type sheets
+_ISSUE_TYPE_HEADERS = (
+    "Severity", "Bytes", "Blocks", "Loss Record",
+    "Primary Function", "Source Location", "Stack Trace",
+)
+
+# Named styles for detailed issue rows: (text column style, numeric column style,
+# stack trace column style)
+_ROW_STYLES = {
+    IssueSeverity.CRITICAL: ("issue_critical", "issue_critical_numeric", "issue_critical_trace"),
+    IssueSeverity.HIGH: ("issue_high", "issue_high_numeric", "issue_high_trace"),
+}
+_DEFAULT_ROW_STYLES = ("issue_normal", "issue_numeric", "issue_trace")
+
+# Named style of table header cells
+_HEADER_STYLE = "header"
+
+# xlsxwriter formats matching the ``_style_sets`` of the openpyxl backend, plus
+# the per-type sheet title, totals and stack trace cells
+_XLSXWRITER_FORMATS = {
+    "sheet_title": {"bold": True, "font_size": 16, "align": "center", "valign": "vcenter"},
+    "section": {"bold": True, "font_size": 14, "bg_color": "#E6E6FA"},
+    "header": {"bold": True, "font_size": 12, "bg_color": "#E6E6FA",
+               "align": "center", "valign": "vcenter", "border": 1},
+    "critical_note": {"bold": True, "bg_color": "#FFCCCC"},
+    "high_note": {"bold": True, "bg_color": "#FFE6CC"},
+    "critical": {"bg_color": "#FFCCCC", "border": 1},
+    "high": {"bg_color": "#FFE6CC", "border": 1},
+    "bordered": {"border": 1},
+    "title": {"bold": True, "font_size": 14},
+    "bold": {"bold": True},
+    "trace": {"text_wrap": True, "valign": "top"},
+    "default": {},
+}
+
+# Write buffer used when saving the xlsx archive
+_SAVE_BUFFER_SIZE = 1 << 20
+
+# Excel's default row height (points) for the default font
+_STANDARD_ROW_HEIGHT = 15
+
+
 class ExcelReportError(Exception):
     """Custom exception for Excel report generation errors."""
     pass
@@ -35,23 +114,117 @@ class ExcelReporter:
     
     This class creates comprehensive Excel workbooks with multiple worksheets
     containing summary statistics, detailed issue listings, and analysis data.
+    
+    By default workbooks are created in openpyxl's write-only mode, so rows are
+    streamed to the output file as they are appended instead of being kept in
+    an in-memory cell grid. Pass ``streaming=False`` to build a regular,
+    fully editable workbook instead.
+    
+    ``generate_report`` can alternatively write the report with xlsxwriter in
+    constant-memory mode (``backend="xlsxwriter"``), which is faster and keeps
+    only the current row in memory. xlsxwriter is an optional dependency.
     """
     
-    def __init__(self):
-        """Initialize the Excel reporter with default styling."""
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, streaming: bool = True,
+                 backend: Literal["openpyxl", "xlsxwriter"] = "openpyxl"):
+        """
+        Initialize the Excel reporter with default styling.
         
-        # Define common styles
-        self.header_font = Font(bold=True, size=12)
-        self.title_font = Font(bold=True, size=14)
-        self.critical_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-        self.high_fill = PatternFill(start_color="FFE6CC", end_color="FFE6CC", fill_type="solid")
-        self.header_fill = PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid")
+        Args:
+            streaming: Create write-only workbooks that stream rows to disk
+            backend: Library used by ``generate_report`` to write the file
+            
+        Raises:
+            ExcelReportError: If the backend is unknown or not installed
+        """
+        if backend not in ("openpyxl", "xlsxwriter"):
+            raise ExcelReportError(f"Unknown Excel backend: {backend}")
+        if backend == "xlsxwriter" and xlsxwriter is None:
+            raise ExcelReportError(
+                "xlsxwriter is required for the xlsxwriter backend. "
+                "Install it with: pip install xlsxwriter"
+            )
         
-        self.center_alignment = Alignment(horizontal="center", vertical="center")
-        self.left_alignment = Alignment(horizontal="left", vertical="center")
+        self.logger = logging.getLogger(__name__)
+        self.streaming = streaming
+        self.backend = backend
         
-        self.thin_border = Border(
+        # Content widths per column of the sheet being built (see _measure_row)
+        self._col_widths: Dict[int, int] = {}
+    
+    # Common styles are built on first use (reports that fail validation never
+    # need them); styles are immutable, so each one is shared by all cells
+    
+    @cached_property
+    def header_font(self) -> Font:
+        return Font(bold=True, size=12)
+    
+    @cached_property
+    def title_font(self) -> Font:
+        return Font(bold=True, size=14)
+    
+    @cached_property
+    def sheet_title_font(self) -> Font:
+        return Font(bold=True, size=16)
+    
+    @cached_property
+    def total_font(self) -> Font:
+        return Font(bold=True, size=11)
+    
+    @cached_property
+    def bold_font(self) -> Font:
+        return Font(bold=True)
+    
+    @cached_property
+    def critical_fill(self) -> PatternFill:
+        return PatternFill(start_color="FFFFCCCC", end_color="FFFFCCCC", fill_type="solid")
+    
+    @cached_property
+    def high_fill(self) -> PatternFill:
+        return PatternFill(start_color="FFFFE6CC", end_color="FFFFE6CC", fill_type="solid")
+    
+    @cached_property
+    def header_fill(self) -> PatternFill:
+        return PatternFill(start_color="FFE6E6FA", end_color="FFE6E6FA", fill_type="solid")
+    
+    @cached_property
+    def _style_sets(self) -> Dict[str, Dict[str, Any]]:
+        # Named groups of ``_cell`` style arguments, shared with the xlsxwriter formats
+        return {
+            "sheet_title": {"font": self.sheet_title_font, "alignment": self.center_alignment},
+            "section": {"font": self.title_font, "fill": self.header_fill},
+            "header": {"font": self.header_font, "fill": self.header_fill,
+                       "alignment": self.center_alignment, "border": self.thin_border},
+            "critical_note": {"font": self.bold_font, "fill": self.critical_fill},
+            "high_note": {"font": self.bold_font, "fill": self.high_fill},
+            "critical": {"fill": self.critical_fill, "border": self.thin_border},
+            "high": {"fill": self.high_fill, "border": self.thin_border},
+            "bordered": {"border": self.thin_border},
+        }
+    
+    @cached_property
+    def center_alignment(self) -> Alignment:
+        return Alignment(horizontal="center", vertical="center")
+    
+    @cached_property
+    def left_alignment(self) -> Alignment:
+        return Alignment(horizontal="left", vertical="center")
+    
+    @cached_property
+    def right_alignment(self) -> Alignment:
+        return Alignment(horizontal="right", vertical="center")
+    
+    @cached_property
+    def wrap_alignment(self) -> Alignment:
+        return Alignment(horizontal="left", vertical="top", wrap_text=True)
+    
+    @cached_property
+    def top_wrap_alignment(self) -> Alignment:
+        return Alignment(wrap_text=True, vertical="top")
+    
+    @cached_property
+    def thin_border(self) -> Border:
+        return Border(
             left=Side(style="thin"),
             right=Side(style="thin"),
             top=Side(style="thin"),
@@ -69,17 +242,61 @@ class ExcelReporter:
             ExcelReportError: If workbook creation fails
         """
         try:
-            workbook = Workbook()
-            # Remove the default sheet
+            workbook = Workbook(write_only=self.streaming)
+            # Remove the default sheet (write-only workbooks start without one)
             if "Sheet" in workbook.sheetnames:
                 workbook.remove(workbook["Sheet"])
             
-            self.logger.info("Created new Excel workbook")
+            self._register_named_styles(workbook)
+            
+            mode = "write-only" if self.streaming else "standard"
+            self.logger.info(f"Created new Excel workbook ({mode} mode)")
             return workbook
             
         except Exception as e:
             raise ExcelReportError(f"Failed to create Excel workbook: {str(e)}") from e
     
+    def _register_named_styles(self, workbook: Workbook) -> None:
+        """
+        Register the named styles used for table headers and issue rows on the workbook.
+        
+        Named styles are stored once in the workbook's style table and cells
+        reference them by name, so each cell needs a single style assignment.
+        Styles that are already registered are left untouched.
+        
+        Args:
+            workbook: The Excel workbook to register the styles on
+        """
+        variants = (
+            (_DEFAULT_ROW_STYLES, None),
+            (_ROW_STYLES[IssueSeverity.CRITICAL], self.critical_fill),
+            (_ROW_STYLES[IssueSeverity.HIGH], self.high_fill),
+        )
+        
+        registered = set(workbook.named_styles)
+        if _HEADER_STYLE not in registered:
+            workbook.add_named_style(NamedStyle(
+                name=_HEADER_STYLE,
+                font=self.header_font,
+                fill=self.header_fill,
+                border=self.thin_border,
+                alignment=self.center_alignment,
+            ))
+        
+        for (text_style, numeric_style, trace_style), fill in variants:
+            for style_name, alignment in ((text_style, self.left_alignment),
+                                          (numeric_style, self.right_alignment),
+                                          (trace_style, self.wrap_alignment)):
+                if style_name in registered:
+                    continue
+                workbook.add_named_style(NamedStyle(
+                    name=style_name,
+                    font=DEFAULT_FONT,
+                    fill=fill,
+                    border=self.thin_border,
+                    alignment=alignment,
+                ))
+    
     def create_worksheet(self, workbook: Workbook, title: str) -> Worksheet:
         """
         Create a new worksheet in the workbook with the given title.
@@ -102,13 +319,18 @@ class ExcelReporter:
         except Exception as e:
             raise ExcelReportError(f"Failed to create worksheet '{title}': {str(e)}") from e
     
-    def save_workbook(self, workbook: Workbook, output_path: str) -> None:
+    def save_workbook(self, workbook: Workbook, output_path: str, compression_level: int = 6) -> None:
         """
         Save the workbook to the specified file path.
         
+        The xlsx archive is written by openpyxl's ExcelWriter into a ZipFile
+        opened here, so the deflate level can be chosen: 1 is fastest, 6 matches
+        openpyxl's default, 9 gives the smallest files.
+        
         Args:
             workbook: The Excel workbook to save
             output_path: The file path where to save the workbook
+            compression_level: Deflate level for the xlsx archive (0-9)
             
         Raises:
             ExcelReportError: If saving fails
@@ -118,8 +340,16 @@ class ExcelReporter:
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save the workbook
-            workbook.save(output_path)
+            # Mirror Workbook.save(): write-only workbooks need at least one sheet
+            if workbook.write_only and not workbook.worksheets:
+                workbook.create_sheet()
+            workbook.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+            
+            # Save the workbook through a large write buffer
+            with open(output_path, "wb", buffering=_SAVE_BUFFER_SIZE) as stream:
+                archive = ZipFile(stream, "w", ZIP_DEFLATED, allowZip64=True,
+                                  compresslevel=compression_level)
+                ExcelWriter(workbook, archive).save()
             self.logger.info(f"Excel report saved to: {output_path}")
             
         except PermissionError as e:
@@ -136,40 +366,269 @@ class ExcelReporter:
         """
         Apply header styling to a row of cells.
         
+        Only works on standard worksheets (``streaming=False``): cells of
+        write-only worksheets cannot be styled after they are written.
+        
         Args:
             worksheet: The worksheet to apply styling to
             row: The row number to style
             start_col: Starting column (default: 1)
             end_col: Ending column (if None, uses the last column with data)
         """
+        self._register_named_styles(worksheet.parent)
+        
         if end_col is None:
             end_col = worksheet.max_column
         
         for col in range(start_col, end_col + 1):
-            cell = worksheet.cell(row=row, column=col)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.center_alignment
-            cell.border = self.thin_border
+            worksheet.cell(row=row, column=col).style = _HEADER_STYLE
     
     def auto_adjust_column_widths(self, worksheet: Worksheet) -> None:
         """
         Automatically adjust column widths based on content.
         
+        Applies the widths recorded by ``_measure_row`` while the sheet's rows
+        were built, so the sheet is never traversed a second time. This also
+        works for write-only worksheets as long as it is called before the
+        first row is appended.
+        
         Args:
             worksheet: The worksheet to adjust column widths for
         """
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
+        for col, width in self._pop_column_widths().items():
+            worksheet.column_dimensions[_COL_LETTERS[col]].width = width
+    
+    def _pop_column_widths(self) -> Dict[int, int]:
+        """
+        Turn the content lengths recorded by ``_measure_row`` into column widths.
+        
+        The recorded lengths are reset for the next sheet.
+        
+        Returns:
+            Mapping of 1-based column number to width
+        """
+        # Set a reasonable width with some padding, capped at 50 characters
+        widths = {col: min(max_length + 2, 50) for col, max_length in self._col_widths.items()}
+        self._col_widths = {}
+        return widths
+    
+    def _measure_row(self, values: Sequence[Any]) -> Sequence[Any]:
+        """
+        Record the content length of each column in a row being built.
+        
+        Args:
+            values: The row (values or cells) that will be appended
+            
+        Returns:
+            The same row, so calls can wrap row construction inline
+        """
+        col_widths = self._col_widths
+        for col, value in enumerate(values, 1):
+            if isinstance(value, Cell):
+                value = value.value
+            if value:
+                length = len(value) if isinstance(value, str) else len(str(value))
+                if length > col_widths.get(col, 0):
+                    col_widths[col] = length
+        return values
+    
+    def _cell(self, worksheet: Worksheet, value: Any, font: Optional[Font] = None,
+              fill: Optional[PatternFill] = None, alignment: Optional[Alignment] = None,
+              border: Optional[Border] = None) -> Cell:
+        """
+        Create a styled cell that can be appended to a worksheet row.
+        
+        Args:
+            worksheet: The worksheet the cell will be appended to
+            value: The cell value
+            font: Optional font to apply
+            fill: Optional fill to apply
+            alignment: Optional alignment to apply
+            border: Optional border to apply
+            
+        Returns:
+            Cell: A cell usable with both standard and write-only worksheets
+        """
+        cell = WriteOnlyCell(worksheet, value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
+    
+    def _styled_row(self, worksheet: Worksheet, values: Sequence[Any], **styles: Any) -> List[Cell]:
+        """
+        Turn a tuple of values into a row of cells sharing the same styles.
+        
+        Args:
+            worksheet: The worksheet the row will be appended to
+            values: The row values
+            **styles: Style keyword arguments accepted by ``_cell``
+            
+        Returns:
+            List of styled cells ready to be appended
+        """
+        return [self._cell(worksheet, value, **styles) for value in values]
+    
+    def _header_row(self, worksheet: Worksheet, headers: Sequence[str]) -> List[Cell]:
+        """
+        Build a row of table header cells.
+        
+        Args:
+            worksheet: The worksheet the row will be appended to
+            headers: The header labels
             
-            for cell in column:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
+        Returns:
+            List of header cells ready to be appended
+        """
+        self._register_named_styles(worksheet.parent)
+        
+        row = []
+        for header in headers:
+            cell = WriteOnlyCell(worksheet, header)
+            cell.style = _HEADER_STYLE
+            row.append(cell)
+        return row
+    
+    def _append_merged_row(self, worksheet: Worksheet, rows: List[Sequence[Any]], value: Any,
+                           span: int = 4, **styles: Any) -> None:
+        """
+        Buffer a single styled cell spanning the first ``span`` columns.
+        
+        The value and styles live on the top-left cell; the merge is
+        registered for the row it will occupy. Excel draws a merged range's
+        borders from its edge cells, so when the cell has a border the
+        covered cells are written empty with the matching edges (the borders
+        openpyxl's ``MergedCellRange.format()`` gives them).
+        
+        Args:
+            worksheet: The worksheet the row will be appended to
+            rows: The buffered rows of the sheet
+            value: The cell value
+            span: Number of columns to merge, starting at column A
+            **styles: Style keyword arguments accepted by ``_cell``
+        """
+        cells = [self._cell(worksheet, value, **styles)]
+        border = styles.get("border")
+        if border is not None:
+            inner = Border(top=border.top, bottom=border.bottom)
+            last = Border(top=border.top, bottom=border.bottom, right=border.right)
+            cells += [self._cell(worksheet, None, border=inner) for _ in range(span - 2)]
+            cells.append(self._cell(worksheet, None, border=last))
+        rows.append(self._measure_row(cells))
+        row = len(rows)
+        worksheet.merged_cells.add(f"A{row}:{_COL_LETTERS[span]}{row}")
+    
+    @staticmethod
+    def _summarize_trace(issue: MemoryIssue, preview: int = 3) -> tuple:
+        """
+        Extract the report fields derived from an issue's stack trace in one call.
+        
+        Args:
+            issue: The memory issue
+            preview: Number of leading frames to return for display
             
-            # Set a reasonable width with some padding
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        Returns:
+            Tuple of (primary_function, source_location, preview_frames, frame_count)
+        """
+        primary_function, source_location = issue.trace_summary()
+        stack_trace = issue.stack_trace
+        return primary_function, source_location, stack_trace[:preview], len(stack_trace)
+    
+    def _summary_layout(self, classified_issues: ClassifiedIssues) -> List[tuple]:
+        """
+        Describe the rows of the summary sheet independently of the backend.
+        
+        Args:
+            classified_issues: The classified issues to summarize
+            
+        Returns:
+            List of (kind, values, style) tuples, one per sheet row. ``kind`` is
+            "row" or "merged" (a single value spanning columns A-D) and
+            ``style`` is a key of ``_style_sets`` or None for plain values.
+        """
+        statistics = classified_issues.statistics
+        layout = [
+            ("merged", ("Valgrind Memory Analysis Summary",), "sheet_title"),
+            
+            # Overall Statistics Section
+            ("row", (), None),
+            ("merged", ("Overall Statistics",), "section"),
+            ("row", ("Total Issues:", statistics.total_issues,
+                     "Total Bytes Lost:", statistics.total_bytes_lost), None),
+            ("row", ("Total Blocks Lost:", statistics.total_blocks_lost), None),
+        ]
+        
+        # Critical Issues Highlighting
+        critical_count = statistics.severity_distribution.get(IssueSeverity.CRITICAL, 0)
+        high_count = statistics.severity_distribution.get(IssueSeverity.HIGH, 0)
+        
+        if critical_count > 0:
+            layout.append(("row", ("⚠️ Critical Issues:", critical_count), "critical_note"))
+        
+        if high_count > 0:
+            layout.append(("row", ("⚠️ High Priority Issues:", high_count), "high_note"))
+        
+        # Only types that actually occurred, in IssueType declaration order
+        populated_types = sorted(
+            ((t, c) for t, c in statistics.issues_by_type.items() if c > 0),
+            key=lambda item: _TYPE_ORDER[item[0]]
+        )
+        
+        # Issues by Type Section (critical issue types are highlighted)
+        layout += [
+            ("row", (), None),
+            ("row", (), None),
+            ("merged", ("Issues by Type",), "section"),
+            ("row", ("Issue Type", "Count", "Percentage", "Bytes Lost"), "header"),
+        ]
+        percentage_by_type = classified_issues.issues_percentage_by_type
+        for issue_type, count in populated_types:
+            percentage = percentage_by_type.get(issue_type, 0)
+            bytes_lost = statistics.bytes_by_type.get(issue_type, 0)
+            layout.append((
+                "row",
+                (_TYPE_DISPLAY[issue_type], count, f"{percentage:.1f}%", bytes_lost),
+                _FILL_FOR_TYPE.get(issue_type, "bordered"),
+            ))
+        
+        # Bytes Distribution Section
+        layout += [
+            ("row", (), None),
+            ("row", (), None),
+            ("merged", ("Memory Loss Distribution",), "section"),
+            ("row", ("Issue Type", "Bytes Lost", "Percentage", "Avg per Issue"), "header"),
+        ]
+        bytes_percentage_by_type = classified_issues.bytes_percentage_by_type
+        for issue_type, count in populated_types:
+            bytes_lost = statistics.bytes_by_type.get(issue_type, 0)
+            if bytes_lost <= 0:
+                continue
+            percentage = bytes_percentage_by_type.get(issue_type, 0)
+            avg_per_issue = bytes_lost / count if count > 0 else 0
+            layout.append((
+                "row",
+                (_TYPE_DISPLAY[issue_type], bytes_lost, f"{percentage:.1f}%", f"{avg_per_issue:.1f}"),
+                _FILL_FOR_TYPE.get(issue_type, "bordered"),
+            ))
+        
+        # Top Issue Sources Section (if available)
+        top_sources = statistics.top_sources(10)  # Show top 10
+        if top_sources:
+            layout += [
+                ("row", (), None),
+                ("row", (), None),
+                ("merged", ("Top Issue Sources",), "section"),
+                ("merged", ("Source Location",), "header"),
+            ]
+            for source in top_sources:
+                layout.append(("merged", (source,), "bordered"))
+        
+        return layout
     
     def create_summary_sheet(self, workbook: Workbook, classified_issues: ClassifiedIssues) -> Worksheet:
         """
@@ -187,172 +646,27 @@ class ExcelReporter:
         """
         try:
             worksheet = self.create_worksheet(workbook, "Summary")
-            statistics = classified_issues.statistics
+            style_sets = self._style_sets
             
-            # Title
-            worksheet["A1"] = "Valgrind Memory Analysis Summary"
-            worksheet["A1"].font = Font(bold=True, size=16)
-            worksheet.merge_cells("A1:D1")
-            worksheet["A1"].alignment = self.center_alignment
-            
-            # Overall Statistics Section
-            row = 3
-            worksheet[f"A{row}"] = "Overall Statistics"
-            worksheet[f"A{row}"].font = self.title_font
-            worksheet[f"A{row}"].fill = self.header_fill
-            worksheet.merge_cells(f"A{row}:D{row}")
-            
-            row += 1
-            worksheet[f"A{row}"] = "Total Issues:"
-            worksheet[f"B{row}"] = statistics.total_issues
-            worksheet[f"C{row}"] = "Total Bytes Lost:"
-            worksheet[f"D{row}"] = statistics.total_bytes_lost
-            
-            row += 1
-            worksheet[f"A{row}"] = "Total Blocks Lost:"
-            worksheet[f"B{row}"] = statistics.total_blocks_lost
-            
-            # Critical Issues Highlighting
-            critical_count = statistics.severity_distribution.get(IssueSeverity.CRITICAL, 0)
-            high_count = statistics.severity_distribution.get(IssueSeverity.HIGH, 0)
-            
-            if critical_count > 0:
-                row += 1
-                worksheet[f"A{row}"] = "⚠️ Critical Issues:"
-                worksheet[f"B{row}"] = critical_count
-                worksheet[f"A{row}"].fill = self.critical_fill
-                worksheet[f"B{row}"].fill = self.critical_fill
-                worksheet[f"A{row}"].font = Font(bold=True)
-                worksheet[f"B{row}"].font = Font(bold=True)
-            
-            if high_count > 0:
-                row += 1
-                worksheet[f"A{row}"] = "⚠️ High Priority Issues:"
-                worksheet[f"B{row}"] = high_count
-                worksheet[f"A{row}"].fill = self.high_fill
-                worksheet[f"B{row}"].fill = self.high_fill
-                worksheet[f"A{row}"].font = Font(bold=True)
-                worksheet[f"B{row}"].font = Font(bold=True)
-            
-            # Issues by Type Section
-            row += 3
-            worksheet[f"A{row}"] = "Issues by Type"
-            worksheet[f"A{row}"].font = self.title_font
-            worksheet[f"A{row}"].fill = self.header_fill
-            worksheet.merge_cells(f"A{row}:D{row}")
-            
-            row += 1
-            # Headers
-            headers = ["Issue Type", "Count", "Percentage", "Bytes Lost"]
-            for col, header in enumerate(headers, 1):
-                cell = worksheet.cell(row=row, column=col, value=header)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
-                cell.alignment = self.center_alignment
-                cell.border = self.thin_border
-            
-            # Data rows
-            percentage_by_type = statistics.get_percentage_by_type()
-            for issue_type in IssueType:
-                if issue_type in statistics.issues_by_type and statistics.issues_by_type[issue_type] > 0:
-                    row += 1
-                    count = statistics.issues_by_type[issue_type]
-                    percentage = percentage_by_type.get(issue_type, 0)
-                    bytes_lost = statistics.bytes_by_type.get(issue_type, 0)
-                    
-                    # Format issue type name
-                    type_name = issue_type.value.replace("_", " ").title()
-                    
-                    worksheet[f"A{row}"] = type_name
-                    worksheet[f"B{row}"] = count
-                    worksheet[f"C{row}"] = f"{percentage:.1f}%"
-                    worksheet[f"D{row}"] = bytes_lost
-                    
-                    # Apply highlighting for critical issue types
-                    if issue_type in [IssueType.DEFINITELY_LOST, IssueType.INVALID_READ, 
-                                    IssueType.INVALID_WRITE, IssueType.USE_AFTER_FREE]:
-                        for col in range(1, 5):
-                            worksheet.cell(row=row, column=col).fill = self.critical_fill
-                    elif issue_type == IssueType.POSSIBLY_LOST:
-                        for col in range(1, 5):
-                            worksheet.cell(row=row, column=col).fill = self.high_fill
-                    
-                    # Apply borders
-                    for col in range(1, 5):
-                        worksheet.cell(row=row, column=col).border = self.thin_border
-            
-            # Bytes Distribution Section
-            row += 3
-            worksheet[f"A{row}"] = "Memory Loss Distribution"
-            worksheet[f"A{row}"].font = self.title_font
-            worksheet[f"A{row}"].fill = self.header_fill
-            worksheet.merge_cells(f"A{row}:D{row}")
-            
-            row += 1
-            # Headers
-            headers = ["Issue Type", "Bytes Lost", "Percentage", "Avg per Issue"]
-            for col, header in enumerate(headers, 1):
-                cell = worksheet.cell(row=row, column=col, value=header)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
-                cell.alignment = self.center_alignment
-                cell.border = self.thin_border
-            
-            # Data rows
-            bytes_percentage_by_type = statistics.get_bytes_percentage_by_type()
-            for issue_type in IssueType:
-                if issue_type in statistics.bytes_by_type and statistics.bytes_by_type[issue_type] > 0:
-                    row += 1
-                    bytes_lost = statistics.bytes_by_type[issue_type]
-                    percentage = bytes_percentage_by_type.get(issue_type, 0)
-                    count = statistics.issues_by_type.get(issue_type, 1)
-                    avg_per_issue = bytes_lost / count if count > 0 else 0
-                    
-                    # Format issue type name
-                    type_name = issue_type.value.replace("_", " ").title()
-                    
-                    worksheet[f"A{row}"] = type_name
-                    worksheet[f"B{row}"] = bytes_lost
-                    worksheet[f"C{row}"] = f"{percentage:.1f}%"
-                    worksheet[f"D{row}"] = f"{avg_per_issue:.1f}"
-                    
-                    # Apply highlighting for critical issue types
-                    if issue_type in [IssueType.DEFINITELY_LOST, IssueType.INVALID_READ, 
-                                    IssueType.INVALID_WRITE, IssueType.USE_AFTER_FREE]:
-                        for col in range(1, 5):
-                            worksheet.cell(row=row, column=col).fill = self.critical_fill
-                    elif issue_type == IssueType.POSSIBLY_LOST:
-                        for col in range(1, 5):
-                            worksheet.cell(row=row, column=col).fill = self.high_fill
-                    
-                    # Apply borders
-                    for col in range(1, 5):
-                        worksheet.cell(row=row, column=col).border = self.thin_border
-            
-            # Top Issue Sources Section (if available)
-            if statistics.top_sources:
-                row += 3
-                worksheet[f"A{row}"] = "Top Issue Sources"
-                worksheet[f"A{row}"].font = self.title_font
-                worksheet[f"A{row}"].fill = self.header_fill
-                worksheet.merge_cells(f"A{row}:D{row}")
-                
-                row += 1
-                worksheet[f"A{row}"] = "Source Location"
-                worksheet[f"A{row}"].font = self.header_font
-                worksheet[f"A{row}"].fill = self.header_fill
-                worksheet[f"A{row}"].alignment = self.center_alignment
-                worksheet[f"A{row}"].border = self.thin_border
-                worksheet.merge_cells(f"A{row}:D{row}")
-                
-                for source in statistics.top_sources[:10]:  # Show top 10
-                    row += 1
-                    worksheet[f"A{row}"] = source
-                    worksheet[f"A{row}"].border = self.thin_border
-                    worksheet.merge_cells(f"A{row}:D{row}")
+            # Rows are buffered so column widths can be set before they are written
+            self._col_widths = {}
+            rows: List[Sequence[Any]] = []
+            for kind, values, style in self._summary_layout(classified_issues):
+                if kind == "merged":
+                    self._append_merged_row(worksheet, rows, values[0], **style_sets[style])
+                elif style is None:
+                    rows.append(self._measure_row(values))
+                elif style == "header":
+                    rows.append(self._measure_row(self._header_row(worksheet, values)))
+                else:
+                    rows.append(self._measure_row(
+                        self._styled_row(worksheet, values, **style_sets[style])
+                    ))
             
-            # Auto-adjust column widths
+            # Auto-adjust column widths, then stream the rows
             self.auto_adjust_column_widths(worksheet)
+            for values in rows:
+                worksheet.append(values)
             
             self.logger.debug("Summary worksheet created successfully")
             return worksheet
@@ -375,13 +689,54 @@ class ExcelReporter:
             ExcelReportError: If detailed sheet creation fails
         """
         try:
+            self._register_named_styles(workbook)
             worksheet = self.create_worksheet(workbook, "Detailed Issues")
             
+            # Set column widths for better readability (before any row is streamed)
+            column_widths = {
+                'A': 18,  # Issue Type
+                'B': 12,  # Severity
+                'C': 10,  # Bytes
+                'D': 8,   # Blocks
+                'E': 12,  # Loss Record
+                'F': 25,  # Primary Function
+                'G': 30,  # Source Location
+                'H': 50   # Stack Trace
+            }
+            
+            for col_letter, width in column_widths.items():
+                worksheet.column_dimensions[col_letter].width = width
+            
+            # Project the issues into per-column lists once (structure of arrays),
+            # so the row loop below only indexes flat lists
+            type_names = [_TYPE_DISPLAY[issue.issue_type] for issue in issues]
+            severity_names = [issue.resolved_severity.name for issue in issues]
+            bytes_counts = [issue.bytes_count for issue in issues]
+            blocks_counts = [issue.blocks_count for issue in issues]
+            loss_records = [issue.loss_record for issue in issues]
+            row_styles = [_ROW_STYLES.get(issue.resolved_severity, _DEFAULT_ROW_STYLES) for issue in issues]
+            trace_summaries = [
+                self._summarize_trace(issue, preview=3)
+                for issue in issues
+            ]
+            
+            # Rows are as tall as their stack trace needs; the most common height
+            # becomes the sheet default so only the other rows need a RowDimension
+            row_heights = [max(60, summary[3] * 15) for summary in trace_summaries]
+            default_height = Counter(row_heights).most_common(1)[0][0] if row_heights else 60
+            worksheet.sheet_format.defaultRowHeight = default_height
+            worksheet.sheet_format.customHeight = True
+            
             # Title
-            worksheet["A1"] = "Detailed Memory Issues Report"
-            worksheet["A1"].font = Font(bold=True, size=16)
-            worksheet.merge_cells("A1:H1")
-            worksheet["A1"].alignment = self.center_alignment
+            worksheet.row_dimensions[1].height = _STANDARD_ROW_HEIGHT
+            worksheet.append([self._cell(worksheet, "Detailed Memory Issues Report",
+                                         font=self.sheet_title_font, alignment=self.center_alignment)])
+            worksheet.merged_cells.add("A1:H1")
+            
+            # Add summary information at the top
+            worksheet.row_dimensions[2].height = _STANDARD_ROW_HEIGHT
+            worksheet.append([self._cell(worksheet, f"Total Issues: {len(issues)}",
+                                         font=self.total_font)])
             
             # Headers row
             row = 3
@@ -396,104 +751,55 @@ class ExcelReporter:
                 "Stack Trace"
             ]
             
-            for col, header in enumerate(headers, 1):
-                cell = worksheet.cell(row=row, column=col, value=header)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
-                cell.alignment = self.center_alignment
-                cell.border = self.thin_border
+            worksheet.row_dimensions[row].height = _STANDARD_ROW_HEIGHT
+            worksheet.append(self._header_row(worksheet, headers))
             
             # Data rows
             row += 1
-            for issue in issues:
-                # Format issue type name
-                issue_type_name = issue.issue_type.value.replace("_", " ").title()
-                
-                # Get primary function from stack trace (first frame with function name)
-                primary_function = "Unknown"
-                if issue.stack_trace:
-                    for frame in issue.stack_trace:
-                        if frame.function_name and frame.function_name != "???":
-                            primary_function = frame.function_name
-                            break
+            for k in range(len(issues)):
+                primary_function, source_location, preview_frames, frame_count = trace_summaries[k]
                 
-                # Get source location (from issue or first stack frame with source info)
-                source_location = issue.source_location or "Unknown"
-                if source_location == "Unknown" and issue.stack_trace:
-                    for frame in issue.stack_trace:
-                        if frame.source_file:
-                            if frame.line_number:
-                                source_location = f"{frame.source_file}:{frame.line_number}"
-                            else:
-                                source_location = frame.source_file
-                            break
+                # Format stack trace (first 3 frames for readability), joined once
+                more = (f"... ({frame_count - 3} more frames)",) if frame_count > 3 else ()
+                stack_trace_text = "\n".join(chain(map(str, preview_frames), more)) or "No stack trace"
                 
-                # Format stack trace (first 3 frames for readability)
-                stack_trace_text = "No stack trace"
-                if issue.stack_trace:
-                    trace_lines = []
-                    for i, frame in enumerate(issue.stack_trace[:3]):  # Limit to first 3 frames
-                        trace_lines.append(str(frame))
-                    stack_trace_text = "\n".join(trace_lines)
-                    if len(issue.stack_trace) > 3:
-                        stack_trace_text += f"\n... ({len(issue.stack_trace) - 3} more frames)"
+                # Row data
+                values = (
+                    type_names[k],
+                    severity_names[k],
+                    bytes_counts[k],
+                    blocks_counts[k],
+                    loss_records[k],
+                    primary_function,
+                    source_location,
+                    stack_trace_text,
+                )
                 
-                # Populate row data
-                worksheet.cell(row=row, column=1, value=issue_type_name)
-                worksheet.cell(row=row, column=2, value=issue.severity.name)
-                worksheet.cell(row=row, column=3, value=issue.bytes_count)
-                worksheet.cell(row=row, column=4, value=issue.blocks_count)
-                worksheet.cell(row=row, column=5, value=issue.loss_record)
-                worksheet.cell(row=row, column=6, value=primary_function)
-                worksheet.cell(row=row, column=7, value=source_location)
-                worksheet.cell(row=row, column=8, value=stack_trace_text)
+                # Set row height for stack trace readability (must precede the append)
+                if row_heights[k] != default_height:
+                    worksheet.row_dimensions[row].height = row_heights[k]
                 
-                # Apply severity-based highlighting
-                fill_color = None
-                if issue.severity == IssueSeverity.CRITICAL:
-                    fill_color = self.critical_fill
-                elif issue.severity == IssueSeverity.HIGH:
-                    fill_color = self.high_fill
+                # Apply severity-based highlighting and formatting via named styles
+                style, numeric_style, trace_style = row_styles[k]
                 
-                # Apply formatting to all cells in the row
-                for col in range(1, 9):
-                    cell = worksheet.cell(row=row, column=col)
-                    cell.border = self.thin_border
-                    cell.alignment = self.left_alignment
-                    
-                    if fill_color:
-                        cell.fill = fill_color
+                row_cells = []
+                for col, value in enumerate(values, 1):
+                    cell = WriteOnlyCell(worksheet, value)
                     
                     # Special formatting for specific columns
-                    if col in [3, 4]:  # Bytes and Blocks columns
-                        cell.alignment = Alignment(horizontal="right", vertical="center")
+                    if col in (3, 4):  # Bytes and Blocks columns
+                        cell.style = numeric_style
                     elif col == 8:  # Stack trace column - wrap text
-                        cell.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+                        cell.style = trace_style
+                    else:
+                        cell.style = style
+                    
+                    row_cells.append(cell)
                 
-                # Set row height for stack trace readability
-                worksheet.row_dimensions[row].height = max(60, len(issue.stack_trace) * 15)
+                worksheet.append(row_cells)
                 
                 row += 1
             
-            # Set column widths for better readability
-            column_widths = {
-                'A': 18,  # Issue Type
-                'B': 12,  # Severity
-                'C': 10,  # Bytes
-                'D': 8,   # Blocks
-                'E': 12,  # Loss Record
-                'F': 25,  # Primary Function
-                'G': 30,  # Source Location
-                'H': 50   # Stack Trace
-            }
-            
-            for col_letter, width in column_widths.items():
-                worksheet.column_dimensions[col_letter].width = width
-            
-            # Add summary information at the top
-            worksheet["A2"] = f"Total Issues: {len(issues)}"
-            worksheet["A2"].font = Font(bold=True, size=11)
-            
             # Add filters to the header row
             worksheet.auto_filter.ref = f"A{3}:H{row-1}"
             
@@ -503,38 +809,82 @@ class ExcelReporter:
         except Exception as e:
             raise ExcelReportError(f"Failed to create detailed issues worksheet: {str(e)}") from e
 
-    def create_issue_type_sheets(self, workbook: Workbook, classified_issues: ClassifiedIssues) -> None:
+    def create_issue_type_sheets(self, workbook: Workbook,
+                                 issues: Union[ClassifiedIssues, List[MemoryIssue]]) -> None:
         """
         Create separate worksheets for each issue type.
         
+        Sheets are created in IssueType declaration order. A flat issue list is
+        bucketed by type in a single pass, keeping the order of the input
+        within each bucket; classified issues are used as already bucketed.
+        
         Args:
             workbook: The Excel workbook to add worksheets to
-            classified_issues: The analyzed and classified memory issues data
+            issues: The analyzed and classified memory issues data, or a flat
+                list of memory issues
         """
         try:
-            # Define user-friendly sheet names for each issue type
-            sheet_names = {
-                IssueType.DEFINITELY_LOST: "Definitely Lost",
-                IssueType.POSSIBLY_LOST: "Possibly Lost", 
-                IssueType.STILL_REACHABLE: "Still Reachable",
-                IssueType.INVALID_READ: "Invalid Reads",
-                IssueType.INVALID_WRITE: "Invalid Writes",
-                IssueType.USE_AFTER_FREE: "Use After Free",
-                IssueType.OTHER: "Other Issues"
-            }
+            if isinstance(issues, ClassifiedIssues):
+                buckets = issues.issues_by_type
+            else:
+                buckets = defaultdict(list)
+                for issue in issues:
+                    buckets[issue.issue_type].append(issue)
             
             # Create a sheet for each issue type that has issues
-            for issue_type, issues in classified_issues.issues_by_type.items():
-                if issues:  # Only create sheet if there are issues of this type
-                    sheet_name = sheet_names.get(issue_type, issue_type.value.replace("_", " ").title())
-                    self.logger.debug(f"Creating sheet for {issue_type.value}: {len(issues)} issues")
+            for issue_type, type_issues in sorted(buckets.items(), key=lambda item: _TYPE_ORDER[item[0]]):
+                if type_issues:  # Only create sheet if there are issues of this type
+                    sheet_name = _SHEET_NAMES.get(issue_type, _TYPE_DISPLAY[issue_type])
+                    self.logger.debug(f"Creating sheet for {issue_type.value}: {len(type_issues)} issues")
                     
                     worksheet = self.create_worksheet(workbook, sheet_name)
-                    self.populate_issue_type_sheet(worksheet, issues, issue_type)
+                    self.populate_issue_type_sheet(worksheet, type_issues, issue_type)
                     
         except Exception as e:
             raise ExcelReportError(f"Failed to create issue type sheets: {str(e)}") from e
     
+    def _issue_type_rows(self, issues: List[MemoryIssue]) -> tuple:
+        """
+        Build the data rows of a per-type sheet as plain values.
+        
+        Column widths are recorded for every row and the byte and block
+        totals are accumulated in the same pass.
+        
+        Args:
+            issues: List of memory issues of the specific type
+            
+        Returns:
+            Tuple of (rows, total_bytes, total_blocks)
+        """
+        total_bytes = 0
+        total_blocks = 0
+        data_rows = []
+        for issue in issues:
+            total_bytes += issue.bytes_count
+            total_blocks += issue.blocks_count
+            
+            primary_function, source_location, preview_frames, frame_count = self._summarize_trace(
+                issue, preview=5
+            )
+            
+            # Stack Trace (formatted), joined once
+            more = (f"... and {frame_count - 5} more frames",) if frame_count > 5 else ()
+            stack_trace_text = "\n".join(chain(
+                (f"{i}. {frame}" for i, frame in enumerate(preview_frames, 1)), more
+            )) or "No stack trace available"
+            
+            data_rows.append(self._measure_row([
+                issue.resolved_severity.name,
+                issue.bytes_count,
+                issue.blocks_count,
+                issue.loss_record,
+                primary_function,
+                source_location,
+                stack_trace_text,
+            ]))
+        
+        return data_rows, total_bytes, total_blocks
+    
     def populate_issue_type_sheet(self, worksheet: Worksheet, issues: List[MemoryIssue], issue_type: IssueType) -> None:
         """
         Populate a worksheet with issues of a specific type.
@@ -545,85 +895,38 @@ class ExcelReporter:
             issue_type: The type of issues in this sheet
         """
         try:
-            # Add title
-            title = f"{issue_type.value.replace('_', ' ').title()} Issues ({len(issues)} total)"
-            worksheet['A1'] = title
-            worksheet['A1'].font = Font(bold=True, size=14)
+            self._col_widths = {}
             
-            # Add summary info
-            total_bytes = sum(issue.bytes_count for issue in issues)
-            total_blocks = sum(issue.blocks_count for issue in issues)
+            # Data rows (written from row 6)
+            data_rows, total_bytes, total_blocks = self._issue_type_rows(issues)
+            for values in data_rows:
+                values[-1] = self._cell(worksheet, values[-1], alignment=self.top_wrap_alignment)
             
-            worksheet['A2'] = f"Total Bytes: {total_bytes:,}"
-            worksheet['A3'] = f"Total Blocks: {total_blocks:,}"
-            worksheet['A2'].font = Font(bold=True)
-            worksheet['A3'].font = Font(bold=True)
+            # Title and summary info
+            title = f"{_TYPE_DISPLAY[issue_type]} Issues ({len(issues)} total)"
             
-            # Headers starting at row 5
-            headers = [
-                "Severity", "Bytes", "Blocks", "Loss Record", 
-                "Primary Function", "Source Location", "Stack Trace"
+            head_rows = [
+                self._measure_row([self._cell(worksheet, title, font=self.title_font)]),
+                self._measure_row([self._cell(worksheet, f"Total Bytes: {total_bytes:,}", font=self.bold_font)]),
+                self._measure_row([self._cell(worksheet, f"Total Blocks: {total_blocks:,}", font=self.bold_font)]),
+                [],
+                self._measure_row(self._header_row(worksheet, _ISSUE_TYPE_HEADERS)),
             ]
             
-            for col, header in enumerate(headers, 1):
-                cell = worksheet.cell(row=5, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.font = Font(bold=True, color="FFFFFF")
+            # Auto-adjust columns before the rows are streamed
+            self.auto_adjust_column_widths(worksheet)
             
-            # Data rows starting at row 6
-            for row, issue in enumerate(issues, 6):
-                # Severity
-                worksheet.cell(row=row, column=1, value=issue.severity.name)
-                
-                # Bytes and Blocks
-                worksheet.cell(row=row, column=2, value=issue.bytes_count)
-                worksheet.cell(row=row, column=3, value=issue.blocks_count)
-                
-                # Loss Record
-                worksheet.cell(row=row, column=4, value=issue.loss_record)
-                
-                # Primary Function (first non-??? function in stack trace)
-                primary_function = "Unknown"
-                if issue.stack_trace:
-                    for frame in issue.stack_trace:
-                        if frame.function_name and frame.function_name != "???":
-                            primary_function = frame.function_name
-                            break
-                worksheet.cell(row=row, column=5, value=primary_function)
-                
-                # Source Location
-                source_location = issue.source_location or "Unknown"
-                if source_location == "Unknown" and issue.stack_trace:
-                    for frame in issue.stack_trace:
-                        if frame.source_file:
-                            if frame.line_number:
-                                source_location = f"{frame.source_file}:{frame.line_number}"
-                            else:
-                                source_location = frame.source_file
-                            break
-                worksheet.cell(row=row, column=6, value=source_location)
-                
-                # Stack Trace (formatted)
-                if issue.stack_trace:
-                    stack_trace_text = "\n".join([
-                        f"{i+1}. {frame}" for i, frame in enumerate(issue.stack_trace[:5])  # Limit to first 5 frames
-                    ])
-                    if len(issue.stack_trace) > 5:
-                        stack_trace_text += f"\n... and {len(issue.stack_trace) - 5} more frames"
-                else:
-                    stack_trace_text = "No stack trace available"
-                
-                cell = worksheet.cell(row=row, column=7, value=stack_trace_text)
-                cell.alignment = Alignment(wrap_text=True, vertical='top')
+            # Data rows are 60pt tall for wrapped text; make that the sheet default
+            # and only give the heading rows an explicit standard height
+            worksheet.sheet_format.defaultRowHeight = 60
+            worksheet.sheet_format.customHeight = True
             
-            # Apply styling and auto-adjust columns
-            self.apply_header_style(worksheet, 5)
-            self.auto_adjust_column_widths(worksheet)
+            for row, values in enumerate(head_rows, 1):
+                worksheet.row_dimensions[row].height = _STANDARD_ROW_HEIGHT
+                worksheet.append(values)
             
-            # Set row height for better readability
-            for row in range(6, len(issues) + 6):
-                worksheet.row_dimensions[row].height = 60  # Adjust for wrapped text
+            for values in data_rows:
+                worksheet.append(values)
                 
             self.logger.debug(f"Populated {issue_type.value} sheet with {len(issues)} issues")
             
@@ -645,7 +948,8 @@ class ExcelReporter:
         worksheet = self.create_worksheet(workbook, "Statistics")
         return worksheet
     
-    def generate_report(self, classified_issues: ClassifiedIssues, output_path: str) -> None:
+    def generate_report(self, classified_issues: ClassifiedIssues, output_path: str,
+                        compression_level: int = 1) -> None:
         """
         Generate a complete Excel report from classified issues data.
         
@@ -655,35 +959,187 @@ class ExcelReporter:
         Args:
             classified_issues: The analyzed and classified memory issues data
             output_path: Path where the Excel file should be saved
+            compression_level: Deflate level for the saved file; the default
+                favours speed, use 6 or higher for archived reports
             
         Raises:
             ExcelReportError: If report generation fails
         """
+        # Validate input data before any workbook or style is built
+        if not classified_issues or not classified_issues.all_issues:
+            raise ExcelReportError("No issues data provided for report generation")
+        
         try:
             self.logger.info("Starting Excel report generation")
             
-            # Validate input data
-            if not classified_issues or not classified_issues.all_issues:
-                raise ExcelReportError("No issues data provided for report generation")
-            
-            # Create workbook
-            workbook = self.create_workbook()
+            if self.backend == "xlsxwriter":
+                # xlsxwriter always uses its own deflate level
+                self._generate_xlsxwriter_report(classified_issues, output_path)
+            else:
+                # Create workbook
+                workbook = self.create_workbook()
+                
+                try:
+                    # Create summary worksheet
+                    self.create_summary_sheet(workbook, classified_issues)
+                    
+                    # Create separate sheets for each issue type
+                    self.create_issue_type_sheets(workbook, classified_issues)
+                    
+                    # Create statistics worksheet
+                    self.create_statistics_sheet(workbook, classified_issues)
+                    
+                    # Save the workbook
+                    self.save_workbook(workbook, output_path, compression_level)
+                except Exception:
+                    self._close_worksheets(workbook)
+                    raise
             
-            # Create summary worksheet
-            self.create_summary_sheet(workbook, classified_issues)
+            self.logger.info("Excel report generation completed successfully")
             
-            # Create separate sheets for each issue type
-            self.create_issue_type_sheets(workbook, classified_issues)
+        except ExcelReportError:
+            raise
+        except Exception as e:
+            raise ExcelReportError(f"Unexpected error during report generation: {str(e)}") from e
+    
+    def _close_worksheets(self, workbook: Workbook) -> None:
+        """
+        Close the write-only worksheets of a workbook that will not be saved.
+        
+        Each open write-only sheet holds a row writer on a temporary file.
+        Left to the garbage collector, the writer may be finalized after its
+        file is closed, printing an "Exception ignored" traceback.
+        
+        Args:
+            workbook: The unsaved workbook
+        """
+        if not workbook.write_only:
+            return
+        for worksheet in workbook.worksheets:
+            if not worksheet.closed:
+                try:
+                    worksheet.close()
+                except Exception as e:
+                    self.logger.debug(f"Could not close worksheet '{worksheet.title}': {e}")
+    
+    def _generate_xlsxwriter_report(self, classified_issues: ClassifiedIssues, output_path: str) -> None:
+        """
+        Write the report with xlsxwriter in constant-memory mode.
+        
+        The sheets match the openpyxl report. Rows are written strictly in
+        order and column widths are set before the first row of each sheet.
+        
+        Args:
+            classified_issues: The analyzed and classified memory issues data
+            output_path: Path where the Excel file should be saved
             
-            # Create statistics worksheet
-            self.create_statistics_sheet(workbook, classified_issues)
+        No file is left at ``output_path`` if writing a sheet fails.
+        
+        Raises:
+            ExcelReportError: If the file cannot be written
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        # Strings are written as-is, like openpyxl does
+        workbook = xlsxwriter.Workbook(output_path, {
+            "constant_memory": True,
+            "strings_to_numbers": False,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+        })
+        try:
+            formats = {name: workbook.add_format(props) for name, props in _XLSXWRITER_FORMATS.items()}
             
-            # Save the workbook
-            self.save_workbook(workbook, output_path)
+            self._write_xlsxwriter_summary(workbook, formats, classified_issues)
             
-            self.logger.info("Excel report generation completed successfully")
+            for issue_type, type_issues in sorted(classified_issues.issues_by_type.items(),
+                                                  key=lambda item: _TYPE_ORDER[item[0]]):
+                if type_issues:
+                    self._write_xlsxwriter_issue_type_sheet(workbook, formats, type_issues, issue_type)
             
-        except ExcelReportError:
+            # Placeholder, like create_statistics_sheet
+            workbook.add_worksheet("Statistics")
+        except Exception:
+            # Closing releases the temporary files of the constant-memory
+            # sheets; the incomplete report it writes is deleted again
+            try:
+                workbook.close()
+            except Exception:
+                pass
+            else:
+                Path(output_path).unlink(missing_ok=True)
             raise
-        except Exception as e:
-            raise ExcelReportError(f"Unexpected error during report generation: {str(e)}") from e
\ No newline at end of file
+        
+        try:
+            workbook.close()
+        except xlsxwriter.exceptions.FileCreateError as e:
+            raise ExcelReportError(f"Failed to save Excel file to '{output_path}': {str(e)}") from e
+        self.logger.info(f"Excel report saved to: {output_path}")
+    
+    def _write_xlsxwriter_summary(self, workbook: Any, formats: Dict[str, Any],
+                                  classified_issues: ClassifiedIssues) -> None:
+        """
+        Write the summary sheet with xlsxwriter.
+        
+        Args:
+            workbook: The xlsxwriter workbook
+            formats: Registered formats keyed like ``_XLSXWRITER_FORMATS``
+            classified_issues: The classified issues to summarize
+        """
+        worksheet = workbook.add_worksheet("Summary")
+        layout = self._summary_layout(classified_issues)
+        
+        self._col_widths = {}
+        for _, values, _ in layout:
+            self._measure_row(values)
+        for col, width in self._pop_column_widths().items():
+            worksheet.set_column(col - 1, col - 1, width)
+        
+        for row, (kind, values, style) in enumerate(layout):
+            cell_format = formats.get(style)
+            if kind == "merged":
+                worksheet.merge_range(row, 0, row, 3, values[0], cell_format)
+            elif values:
+                worksheet.write_row(row, 0, values, cell_format)
+    
+    def _write_xlsxwriter_issue_type_sheet(self, workbook: Any, formats: Dict[str, Any],
+                                           issues: List[MemoryIssue], issue_type: IssueType) -> None:
+        """
+        Write the sheet for one issue type with xlsxwriter.
+        
+        Args:
+            workbook: The xlsxwriter workbook
+            formats: Registered formats keyed like ``_XLSXWRITER_FORMATS``
+            issues: List of memory issues of the specific type
+            issue_type: The type of issues in this sheet
+        """
+        worksheet = workbook.add_worksheet(_SHEET_NAMES.get(issue_type, _TYPE_DISPLAY[issue_type]))
+        
+        self._col_widths = {}
+        data_rows, total_bytes, total_blocks = self._issue_type_rows(issues)
+        head_rows = [
+            ((f"{_TYPE_DISPLAY[issue_type]} Issues ({len(issues)} total)",), formats["title"]),
+            ((f"Total Bytes: {total_bytes:,}",), formats["bold"]),
+            ((f"Total Blocks: {total_blocks:,}",), formats["bold"]),
+            # Constant-memory mode only writes the height of rows with a cell
+            # in them, so the blank row gets one in the default format
+            ((None,), formats["default"]),
+            (_ISSUE_TYPE_HEADERS, formats["header"]),
+        ]
+        for values, _ in head_rows:
+            self._measure_row(values)
+        for col, width in self._pop_column_widths().items():
+            worksheet.set_column(col - 1, col - 1, width)
+        
+        # Data rows are 60pt tall for wrapped text, heading rows standard height
+        worksheet.set_default_row(60)
+        for row, (values, cell_format) in enumerate(head_rows):
+            worksheet.set_row(row, _STANDARD_ROW_HEIGHT)
+            worksheet.write_row(row, 0, values, cell_format)
+        
+        trace_format = formats["trace"]
+        for row, values in enumerate(data_rows, len(head_rows)):
+            worksheet.write_row(row, 0, values[:-1])
+            worksheet.write_string(row, len(values) - 1, values[-1], trace_format)
+        
+        self.logger.debug(f"Populated {issue_type.value} sheet with {len(issues)} issues")
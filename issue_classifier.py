@@ -5,15 +5,20 @@ This module provides functionality to classify and analyze memory issues,
 calculate statistics, and prioritize issues by severity.
 """
 
-from typing import List, Dict, Counter
-from collections import defaultdict, Counter
+import heapq
+from operator import attrgetter
+from typing import Any, Iterable, List, Dict, Optional, Tuple, Union
 
 from models import (
     MemoryIssue, IssueType, IssueSeverity, Statistics, 
-    ClassifiedIssues, StackFrame
+    ClassifiedIssues, StackFrame, SeveritySummary
 )
 
 
+# Sort key for issue priority (see IssueClassifier.prioritize_issues)
+_priority_key = attrgetter("_priority")
+
+
 class IssueClassifier:
     """
     Classifier for categorizing and analyzing memory issues from Valgrind logs.
@@ -22,16 +27,28 @@ class IssueClassifier:
     statistics, and prioritize issues based on severity and impact.
     """
     
+    # Human-readable category names by issue type
+    _CATEGORY_MAPPING = {
+        IssueType.DEFINITELY_LOST: "Definitely Lost",
+        IssueType.POSSIBLY_LOST: "Possibly Lost",
+        IssueType.STILL_REACHABLE: "Still Reachable",
+        IssueType.INVALID_READ: "Invalid Reads",
+        IssueType.INVALID_WRITE: "Invalid Writes",
+        IssueType.USE_AFTER_FREE: "Use After Free",
+        IssueType.OTHER: "Other Issues"
+    }
+    
     def __init__(self):
         """Initialize the IssueClassifier."""
         pass
     
-    def classify_issues(self, issues: List[MemoryIssue]) -> ClassifiedIssues:
+    def classify_issues(self, issues: Iterable[MemoryIssue]) -> ClassifiedIssues:
         """
         Classify and organize memory issues by type and calculate statistics.
         
         Args:
-            issues: List of MemoryIssue objects to classify
+            issues: MemoryIssue objects to classify; any iterable, e.g. the
+                generator from ``LogParser.iter_issues``, is consumed once
             
         Returns:
             ClassifiedIssues object containing organized data and statistics
@@ -39,22 +56,21 @@ class IssueClassifier:
         if not issues:
             return self._create_empty_classification()
         
-        # Group issues by type
-        issues_by_type = self._group_issues_by_type(issues)
-        
-        # Calculate comprehensive statistics
-        statistics = self.calculate_statistics(issues)
+        # Group issues by type and calculate statistics in a single pass
+        buckets, statistics = self._aggregate(issues)
         
         # Sort issues by priority within each type
-        prioritized_issues_by_type = {}
-        for issue_type, type_issues in issues_by_type.items():
-            prioritized_issues_by_type[issue_type] = self.prioritize_issues(type_issues)
+        for bucket in buckets.values():
+            bucket.sort()
         
-        # Sort all issues by priority
-        all_prioritized_issues = self.prioritize_issues(issues)
+        # All issues by priority: merge the sorted buckets instead of re-sorting
+        all_prioritized_issues = [issue for _, _, issue in heapq.merge(*buckets.values())]
         
         return ClassifiedIssues(
-            issues_by_type=prioritized_issues_by_type,
+            issues_by_type={
+                issue_type: [issue for _, _, issue in bucket]
+                for issue_type, bucket in buckets.items()
+            },
             statistics=statistics,
             all_issues=all_prioritized_issues
         )
@@ -68,7 +84,7 @@ class IssueClassifier:
             issues_by_type={},
             bytes_by_type={},
             blocks_by_type={},
-            top_sources=[],
+            source_counts={},
             severity_distribution={}
         )
         
@@ -78,27 +94,90 @@ class IssueClassifier:
             all_issues=[]
         )
     
-    def _group_issues_by_type(self, issues: List[MemoryIssue]) -> Dict[IssueType, List[MemoryIssue]]:
+    def _aggregate(self, issues: Iterable[MemoryIssue],
+                   keep_issues: bool = True) -> Tuple[Dict[IssueType, list], Statistics]:
         """
-        Group issues by their type.
+        Group issues by type and accumulate all statistics in one pass.
+        
+        Bucket entries are (priority key, input position, issue) tuples, so
+        sorting and merging them orders by priority and keeps equal-priority
+        issues in input order, like a stable sort of the issues would.
         
         Args:
-            issues: List of MemoryIssue objects
+            issues: MemoryIssue objects, consumed once
+            keep_issues: Whether to fill the buckets; without them no issue
+                is referenced after it has been counted
             
         Returns:
-            Dictionary mapping IssueType to list of issues
+            Tuple of (decorated issues by type, Statistics)
         """
-        grouped = defaultdict(list)
-        for issue in issues:
-            grouped[issue.issue_type].append(issue)
-        return dict(grouped)
+        buckets: Dict[IssueType, list] = {}
+        issues_by_type: Dict[IssueType, int] = {}
+        bytes_by_type: Dict[IssueType, int] = {}
+        blocks_by_type: Dict[IssueType, int] = {}
+        severity_distribution: Dict[IssueSeverity, int] = {}
+        source_counter: Dict[Union[str, tuple], int] = {}
+        
+        total_bytes = 0
+        total_blocks = 0
+        
+        # Local aliases keep attribute lookups out of the loop
+        get_bucket = buckets.get
+        count_get = issues_by_type.get
+        bytes_get = bytes_by_type.get
+        blocks_get = blocks_by_type.get
+        severity_get = severity_distribution.get
+        source_get = source_counter.get
+        source_key_for = self._source_key
+        
+        position = -1
+        for position, issue in enumerate(issues):
+            issue_type = issue.issue_type
+            bytes_count = issue.bytes_count
+            blocks_count = issue.blocks_count
+            
+            if keep_issues:
+                bucket = get_bucket(issue_type)
+                if bucket is None:
+                    bucket = buckets[issue_type] = []
+                bucket.append((issue._priority, position, issue))
+            
+            # Enum keys are few, so plain dicts beat Counter increments here
+            issues_by_type[issue_type] = count_get(issue_type, 0) + 1
+            bytes_by_type[issue_type] = bytes_get(issue_type, 0) + bytes_count
+            blocks_by_type[issue_type] = blocks_get(issue_type, 0) + blocks_count
+            severity = issue.resolved_severity
+            severity_distribution[severity] = severity_get(severity, 0) + 1
+            
+            total_bytes += bytes_count
+            total_blocks += blocks_count
+            
+            source_key = source_key_for(issue)
+            if source_key:
+                source_counter[source_key] = source_get(source_key, 0) + 1
+        
+        statistics = Statistics(
+            total_issues=position + 1,
+            total_bytes_lost=total_bytes,
+            total_blocks_lost=total_blocks,
+            issues_by_type=issues_by_type,
+            bytes_by_type=bytes_by_type,
+            blocks_by_type=blocks_by_type,
+            source_counts=source_counter,
+            severity_distribution=severity_distribution
+        )
+        return buckets, statistics
     
-    def calculate_statistics(self, issues: List[MemoryIssue]) -> Statistics:
+    def calculate_statistics(self, issues: Iterable[MemoryIssue]) -> Statistics:
         """
         Calculate comprehensive statistics for the given issues.
         
+        Issues are only counted, never kept, so statistics for a huge log can
+        be computed from ``LogParser.iter_issues`` without holding its issues;
+        the parser then only keeps one copy of each distinct frame line.
+        
         Args:
-            issues: List of MemoryIssue objects
+            issues: MemoryIssue objects; any iterable is consumed once
             
         Returns:
             Statistics object with aggregated data
@@ -111,42 +190,11 @@ class IssueClassifier:
                 issues_by_type={},
                 bytes_by_type={},
                 blocks_by_type={},
-                top_sources=[],
+                source_counts={},
                 severity_distribution={}
             )
         
-        # Initialize counters
-        issues_by_type = Counter()
-        bytes_by_type = Counter()
-        blocks_by_type = Counter()
-        severity_distribution = Counter()
-        
-        total_bytes = 0
-        total_blocks = 0
-        
-        # Aggregate data
-        for issue in issues:
-            issues_by_type[issue.issue_type] += 1
-            bytes_by_type[issue.issue_type] += issue.bytes_count
-            blocks_by_type[issue.issue_type] += issue.blocks_count
-            severity_distribution[issue.severity] += 1
-            
-            total_bytes += issue.bytes_count
-            total_blocks += issue.blocks_count
-        
-        # Calculate top sources
-        top_sources = self._identify_top_sources(issues)
-        
-        return Statistics(
-            total_issues=len(issues),
-            total_bytes_lost=total_bytes,
-            total_blocks_lost=total_blocks,
-            issues_by_type=dict(issues_by_type),
-            bytes_by_type=dict(bytes_by_type),
-            blocks_by_type=dict(blocks_by_type),
-            top_sources=top_sources,
-            severity_distribution=dict(severity_distribution)
-        )
+        return self._aggregate(issues, keep_issues=False)[1]
     
     def _identify_top_sources(self, issues: List[MemoryIssue], limit: int = 10) -> List[str]:
         """
@@ -159,21 +207,30 @@ class IssueClassifier:
         Returns:
             List of top source locations ordered by frequency
         """
-        source_counter = Counter()
-        
-        for issue in issues:
-            # Count by source location if available
-            if issue.source_location:
-                source_counter[issue.source_location] += 1
-            # Otherwise, count by top stack frame function
-            elif issue.stack_trace:
-                top_frame = issue.stack_trace[0]
-                if top_frame.function_name != "unknown":
-                    source_key = f"{top_frame.function_name} ({top_frame.library})"
-                    source_counter[source_key] += 1
+        return self.calculate_statistics(issues).top_sources(limit)
+    
+    @staticmethod
+    def _source_key(issue: MemoryIssue) -> Optional[Union[str, tuple]]:
+        """
+        Get the key an issue is counted under for top sources.
         
-        # Return top sources by frequency
-        return [source for source, _ in source_counter.most_common(limit)]
+        Args:
+            issue: The MemoryIssue to attribute
+            
+        Returns:
+            The source location if available, otherwise a (function, library)
+            tuple for the top stack frame, or None if neither is known; tuples
+            are only formatted for the sources that make the top list
+        """
+        # Count by source location if available
+        if issue.source_location:
+            return issue.source_location
+        # Otherwise, count by top stack frame function
+        if issue.stack_trace:
+            top_frame = issue.stack_trace[0]
+            if top_frame.function_name != "unknown":
+                return (top_frame.function_name, top_frame.library)
+        return None
     
     def prioritize_issues(self, issues: List[MemoryIssue]) -> List[MemoryIssue]:
         """
@@ -190,16 +247,7 @@ class IssueClassifier:
         Returns:
             List of issues sorted by priority (highest priority first)
         """
-        def priority_key(issue: MemoryIssue) -> tuple:
-            # Return tuple for sorting: (severity_value, -bytes, -blocks)
-            # Negative bytes and blocks for descending order
-            return (
-                issue.severity.value,  # Lower value = higher severity
-                -issue.bytes_count,    # Higher bytes = higher priority
-                -issue.blocks_count    # Higher blocks = higher priority
-            )
-        
-        return sorted(issues, key=priority_key)
+        return sorted(issues, key=_priority_key)
     
     def get_issues_by_severity(self, issues: List[MemoryIssue], 
                               severity: IssueSeverity) -> List[MemoryIssue]:
@@ -238,13 +286,7 @@ class IssueClassifier:
         Returns:
             Dictionary mapping IssueType to percentage of total bytes
         """
-        if statistics.total_bytes_lost == 0:
-            return {}
-        
-        return {
-            issue_type: (bytes_count / statistics.total_bytes_lost) * 100
-            for issue_type, bytes_count in statistics.bytes_by_type.items()
-        }
+        return statistics.get_bytes_percentage_by_type()
     
     def calculate_issues_percentage_by_type(self, statistics: Statistics) -> Dict[IssueType, float]:
         """
@@ -256,15 +298,9 @@ class IssueClassifier:
         Returns:
             Dictionary mapping IssueType to percentage of total issues
         """
-        if statistics.total_issues == 0:
-            return {}
-        
-        return {
-            issue_type: (count / statistics.total_issues) * 100
-            for issue_type, count in statistics.issues_by_type.items()
-        }
+        return statistics.get_percentage_by_type()
     
-    def get_summary_by_severity(self, statistics: Statistics) -> Dict[IssueSeverity, Dict[str, int]]:
+    def get_summary_by_severity(self, statistics: Statistics) -> Dict[IssueSeverity, SeveritySummary]:
         """
         Get summary statistics grouped by severity level.
         
@@ -274,19 +310,7 @@ class IssueClassifier:
         Returns:
             Dictionary mapping severity to summary statistics
         """
-        summary = {}
-        
-        for severity in IssueSeverity:
-            if severity in statistics.severity_distribution:
-                count = statistics.severity_distribution[severity]
-                summary[severity] = {
-                    'count': count,
-                    'percentage': (count / statistics.total_issues) * 100 if statistics.total_issues > 0 else 0
-                }
-            else:
-                summary[severity] = {'count': 0, 'percentage': 0.0}
-        
-        return summary
+        return statistics.get_summary_by_severity()
     
     def get_bytes_lost_by_category(self, statistics: Statistics) -> Dict[str, int]:
         """
@@ -298,18 +322,8 @@ class IssueClassifier:
         Returns:
             Dictionary mapping category names to total bytes lost
         """
-        category_mapping = {
-            IssueType.DEFINITELY_LOST: "Definitely Lost",
-            IssueType.POSSIBLY_LOST: "Possibly Lost", 
-            IssueType.STILL_REACHABLE: "Still Reachable",
-            IssueType.INVALID_READ: "Invalid Reads",
-            IssueType.INVALID_WRITE: "Invalid Writes",
-            IssueType.USE_AFTER_FREE: "Use After Free",
-            IssueType.OTHER: "Other Issues"
-        }
-        
         return {
-            category_mapping.get(issue_type, str(issue_type)): bytes_count
+            self._CATEGORY_MAPPING.get(issue_type, str(issue_type)): bytes_count
             for issue_type, bytes_count in statistics.bytes_by_type.items()
         }
     
@@ -323,18 +337,8 @@ class IssueClassifier:
         Returns:
             Dictionary mapping category names to total blocks lost
         """
-        category_mapping = {
-            IssueType.DEFINITELY_LOST: "Definitely Lost",
-            IssueType.POSSIBLY_LOST: "Possibly Lost", 
-            IssueType.STILL_REACHABLE: "Still Reachable",
-            IssueType.INVALID_READ: "Invalid Reads",
-            IssueType.INVALID_WRITE: "Invalid Writes",
-            IssueType.USE_AFTER_FREE: "Use After Free",
-            IssueType.OTHER: "Other Issues"
-        }
-        
         return {
-            category_mapping.get(issue_type, str(issue_type)): blocks_count
+            self._CATEGORY_MAPPING.get(issue_type, str(issue_type)): blocks_count
             for issue_type, blocks_count in statistics.blocks_by_type.items()
         }
     
@@ -348,13 +352,7 @@ class IssueClassifier:
         Returns:
             Dictionary mapping source locations to detailed analysis
         """
-        source_analysis = defaultdict(lambda: {
-            'count': 0,
-            'total_bytes': 0,
-            'total_blocks': 0,
-            'issue_types': set(),
-            'severities': set()
-        })
+        source_analysis: Dict[str, Dict[str, Any]] = {}
         
         for issue in issues:
             source_key = issue.source_location or "Unknown"
@@ -364,19 +362,27 @@ class IssueClassifier:
                 if top_frame.function_name != "unknown":
                     source_key = f"{top_frame.function_name} ({top_frame.library})"
             
-            analysis = source_analysis[source_key]
+            analysis = source_analysis.get(source_key)
+            if analysis is None:
+                analysis = source_analysis[source_key] = {
+                    'count': 0,
+                    'total_bytes': 0,
+                    'total_blocks': 0,
+                    'issue_types': set(),
+                    'severities': set()
+                }
             analysis['count'] += 1
             analysis['total_bytes'] += issue.bytes_count
             analysis['total_blocks'] += issue.blocks_count
             analysis['issue_types'].add(issue.issue_type.value)
-            analysis['severities'].add(issue.severity.value)
+            analysis['severities'].add(issue.resolved_severity.value)
         
         # Convert sets to lists for JSON serialization
         for source, analysis in source_analysis.items():
             analysis['issue_types'] = list(analysis['issue_types'])
             analysis['severities'] = list(analysis['severities'])
         
-        return dict(source_analysis)
+        return source_analysis
     
     def get_memory_leak_summary(self, statistics: Statistics) -> Dict[str, any]:
         """
@@ -388,38 +394,4 @@ class IssueClassifier:
         Returns:
             Dictionary with memory leak summary information
         """
-        leak_types = [
-            IssueType.DEFINITELY_LOST,
-            IssueType.POSSIBLY_LOST,
-            IssueType.STILL_REACHABLE
-        ]
-        
-        total_leak_bytes = sum(
-            statistics.bytes_by_type.get(leak_type, 0)
-            for leak_type in leak_types
-        )
-        
-        total_leak_blocks = sum(
-            statistics.blocks_by_type.get(leak_type, 0)
-            for leak_type in leak_types
-        )
-        
-        total_leak_issues = sum(
-            statistics.issues_by_type.get(leak_type, 0)
-            for leak_type in leak_types
-        )
-        
-        return {
-            'total_leaked_bytes': total_leak_bytes,
-            'total_leaked_blocks': total_leak_blocks,
-            'total_leak_issues': total_leak_issues,
-            'leak_percentage_of_total': (
-                (total_leak_bytes / statistics.total_bytes_lost) * 100
-                if statistics.total_bytes_lost > 0 else 0
-            ),
-            'breakdown_by_type': {
-                'definitely_lost_bytes': statistics.bytes_by_type.get(IssueType.DEFINITELY_LOST, 0),
-                'possibly_lost_bytes': statistics.bytes_by_type.get(IssueType.POSSIBLY_LOST, 0),
-                'still_reachable_bytes': statistics.bytes_by_type.get(IssueType.STILL_REACHABLE, 0)
-            }
-        }
\ No newline at end of file
+        return statistics.get_memory_leak_summary()
@@ -7,10 +7,40 @@ and extract memory issue information including stack traces and issue details.
 
 import re
 import os
-from typing import List, Optional, TextIO
+import sys
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, repeat
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
 from pathlib import Path
 
-from models import MemoryIssue, StackFrame, IssueType
+from models import MemoryIssue, StackFrame, IssueType, LazyStackTrace
+
+
+# Whitespace within a single line
+_WS = r'[^\S\n]'
+
+# Encoding of Valgrind logs; captured fields are decoded individually
+_LOG_ENCODING = 'utf-8'
+
+# Raw log content: bytes, or the memory-mapped log file
+_Log = Union[bytes, mmap.mmap]
+
+# Logs smaller than this are parsed in-process; worker start-up would dominate
+_PARALLEL_MIN_SIZE = 10 * 1024 * 1024
+
+# A bare "==PID==" line ends any stack trace and is never an issue, so the
+# log can be split in front of one without changing what is parsed
+_CHUNK_BOUNDARY_PATTERN = re.compile(rb'^[^\S\n]*==\d+==[^\S\n]*$', re.MULTILINE)
+
+# Stack frame lines; like the issue pattern they match raw log bytes
+_STACK_FRAME_PATTERN = re.compile(
+    rb'==\d+==\s+(?:at|by)\s+0x[0-9A-F]+:\s*(.+?)(?:\s+\((.+?)\))?$',
+    re.IGNORECASE
+)
+_ADDRESS_PATTERN = re.compile(rb'0x[0-9A-F]+')
+_FILE_LINE_PATTERN = re.compile(r'([^:]+):(\d+)$')
 
 
 class LogParserError(Exception):
@@ -26,41 +56,48 @@ class LogParser:
     and extracting structured memory issue data for analysis.
     """
     
-    def __init__(self):
-        """Initialize the LogParser with compiled regex patterns."""
-        # Compile regex patterns for better performance
-        self._issue_patterns = self._compile_issue_patterns()
-        self._stack_frame_pattern = re.compile(
-            r'==\d+==\s+(?:at|by)\s+0x[0-9A-F]+:\s*(.+?)(?:\s+\((.+?)\))?$',
-            re.IGNORECASE
+    def __init__(self, max_workers: Optional[int] = 1):
+        """
+        Initialize the LogParser with compiled regex patterns.
+        
+        Args:
+            max_workers: Processes used to parse logs of 10 MB and more; None
+                uses one per CPU. The default, 1, always parses in-process:
+                sending the issues back from workers costs nearly as much as
+                parsing them, so more workers only help with idle cores to spare
+                
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        
+        # Compile regex patterns for better performance; they match raw log
+        # bytes, so only the captured fields need decoding
+        self._issue_pattern = self._compile_issue_pattern()
+        self._valgrind_header_pattern = re.compile(rf'==\d+=={_WS}+Memcheck,'.encode('ascii'))
+        
+    def _compile_issue_pattern(self) -> re.Pattern:
+        """
+        Compile a single regex matching every known memory issue line.
+        
+        Leak lines share one branch, with a named group per leak kind; invalid
+        reads and writes share the other. The pattern is searched over the
+        whole log content, so whitespace (``_WS``) never matches a line break.
+        """
+        pattern = (
+            rf'==\d+=={_WS}+(?:'
+            # Memory leaks: bytes, blocks, leak kind and loss record
+            rf'(?P<bytes>\d[\d,]*)(?:{_WS}+\([^)\n]+\))?{_WS}+bytes?{_WS}+in{_WS}+(?P<blocks>\d[\d,]*){_WS}+blocks?{_WS}+are{_WS}+'
+            rf'(?:(?P<definitely_lost>definitel?y{_WS}+lost)|(?P<possibly_lost>possibl?y{_WS}+lost)'
+            rf'|(?P<still_reachable>still{_WS}+reachabl?e))'
+            rf'{_WS}+in{_WS}+loss{_WS}+record{_WS}+(?P<record>.+)'
+            # Invalid reads and writes: access size
+            rf'|Invalid{_WS}+(?:(?P<invalid_read>read)|(?P<invalid_write>write)){_WS}+of{_WS}+size{_WS}+(?P<size>\d+)'
+            r')'
         )
-        self._valgrind_header_pattern = re.compile(r'==\d+==\s+Memcheck,')
-        
-    def _compile_issue_patterns(self) -> dict:
-        """Compile regex patterns for different types of memory issues."""
-        patterns = {
-            IssueType.DEFINITELY_LOST: re.compile(
-                r'==\d+==\s+([\d,]+)(?:\s+\([^)]+\))?\s+bytes?\s+in\s+([\d,]+)\s+blocks?\s+are\s+definitel?y\s+lost\s+in\s+loss\s+record\s+(.+)',
-                re.IGNORECASE
-            ),
-            IssueType.POSSIBLY_LOST: re.compile(
-                r'==\d+==\s+([\d,]+)(?:\s+\([^)]+\))?\s+bytes?\s+in\s+([\d,]+)\s+blocks?\s+are\s+possibl?y\s+lost\s+in\s+loss\s+record\s+(.+)',
-                re.IGNORECASE
-            ),
-            IssueType.STILL_REACHABLE: re.compile(
-                r'==\d+==\s+([\d,]+)(?:\s+\([^)]+\))?\s+bytes?\s+in\s+([\d,]+)\s+blocks?\s+are\s+still\s+reachabl?e\s+in\s+loss\s+record\s+(.+)',
-                re.IGNORECASE
-            ),
-            IssueType.INVALID_READ: re.compile(
-                r'==\d+==\s+Invalid\s+read\s+of\s+size\s+(\d+)',
-                re.IGNORECASE
-            ),
-            IssueType.INVALID_WRITE: re.compile(
-                r'==\d+==\s+Invalid\s+write\s+of\s+size\s+(\d+)',
-                re.IGNORECASE
-            ),
-        }
-        return patterns
+        return re.compile(pattern.encode('ascii'), re.IGNORECASE)
     
     def parse_file(self, filepath: str) -> List[MemoryIssue]:
         """
@@ -79,13 +116,16 @@ class LogParser:
         self._validate_file(filepath)
         
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as file:
-                # Validate that this is a Valgrind log file
-                self._validate_valgrind_format(file)
-                
-                # Reset file pointer and parse issues
-                file.seek(0)
-                return self._parse_issues(file)
+            with open(filepath, 'rb') as file:
+                # Parse issues straight from the memory-mapped file; pages are
+                # read by the OS as the scan reaches them
+                with _map_log(file) as log:
+                    # Validate that this is a Valgrind log file
+                    self._validate_valgrind_format(log)
+                    
+                    if self.max_workers > 1 and len(log) >= _PARALLEL_MIN_SIZE:
+                        return self._parse_issues_parallel(filepath, log)
+                    return self._parse_issues(log)
                 
         except UnicodeDecodeError as e:
             raise LogParserError(f"File encoding error: {e}")
@@ -116,245 +156,423 @@ class LogParser:
         if path.stat().st_size == 0:
             raise LogParserError(f"File is empty: {filepath}")
     
-    def _validate_valgrind_format(self, file: TextIO) -> None:
+    def _validate_valgrind_format(self, log: _Log) -> None:
         """
-        Validate that the file appears to be a Valgrind log.
+        Validate that the log appears to be a Valgrind log.
+        
+        The header is searched for in the log content that is parsed next, so
+        the start of the file is not read a second time.
         
         Args:
-            file: Open file handle to validate
+            log: Raw log content to validate
             
         Raises:
-            LogParserError: If file doesn't appear to be a Valgrind log
+            LogParserError: If the log doesn't appear to be a Valgrind log
         """
-        # Read first few lines to check for Valgrind header
-        header_found = False
-        lines_checked = 0
-        max_lines_to_check = 50  # Check first 50 lines for header
-        
-        for line in file:
-            lines_checked += 1
-            if self._valgrind_header_pattern.search(line):
-                header_found = True
-                break
-            if lines_checked >= max_lines_to_check:
+        # Check the first 50 lines for the Valgrind header
+        max_lines_to_check = 50
+        head_end = 0
+        for _ in range(max_lines_to_check):
+            line_end = log.find(b'\n', head_end)
+            if line_end == -1:
+                head_end = len(log)
                 break
+            head_end = line_end + 1
         
-        if not header_found:
+        if not self._valgrind_header_pattern.search(log, 0, head_end):
             raise LogParserError(
                 "File does not appear to be a valid Valgrind log file. "
                 "Expected to find Valgrind header within first 50 lines."
             )
     
-    def _parse_issues(self, file: TextIO) -> List[MemoryIssue]:
+    def _parse_issues_parallel(self, filepath: str, log: _Log) -> List[MemoryIssue]:
         """
-        Parse memory issues from the file content.
+        Parse a large log in chunks on a pool of worker processes.
+        
+        Chunks are split in front of bare "==PID==" lines, where the
+        sequential parser is never inside a stack trace, so the concatenated
+        results equal a single in-process parse.
         
         Args:
-            file: Open file handle to parse
+            filepath: Path to the log file, re-mapped by each worker
+            log: The memory-mapped log, used to find chunk boundaries
             
         Returns:
-            List of MemoryIssue objects
+            List of MemoryIssue objects in log order
+            
+        Raises:
+            LogParserError: If a worker dies or cannot read the file
         """
-        issues = []
-        lines = file.readlines()
-        i = 0
+        log_length = len(log)
+        bounds = [0]
+        for i in range(1, self.max_workers):
+            match = _CHUNK_BOUNDARY_PATTERN.search(log, max(bounds[-1], log_length * i // self.max_workers))
+            if not match:
+                break
+            if match.start() > bounds[-1]:
+                bounds.append(match.start())
+        bounds.append(log_length)
         
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Try to match each issue type pattern
-            issue_match = self._match_issue_line(line)
-            if issue_match:
-                issue_type, bytes_count, blocks_count, loss_record = issue_match
-                
-                # Extract stack trace starting from next line
-                stack_trace, lines_consumed = self._extract_stack_trace(lines, i + 1)
-                
-                # Create MemoryIssue object
-                issue = MemoryIssue(
-                    issue_type=issue_type,
-                    bytes_count=bytes_count,
-                    blocks_count=blocks_count,
-                    loss_record=loss_record,
-                    stack_trace=stack_trace,
-                    source_location=self._get_source_location(stack_trace)
-                )
-                
-                issues.append(issue)
-                i += lines_consumed + 1
-            else:
-                i += 1
+        if len(bounds) == 2:
+            return self._parse_issues(log)
         
-        return issues
+        try:
+            with ProcessPoolExecutor(max_workers=len(bounds) - 1) as executor:
+                chunks = executor.map(_parse_chunk, repeat(filepath), bounds[:-1], bounds[1:])
+                return list(chain.from_iterable(chunks))
+        except BrokenProcessPool as e:
+            raise LogParserError(f"Worker process failed while parsing log: {e}")
+        except OSError as e:
+            raise LogParserError(f"Error reading file in worker process: {e}")
     
-    def _match_issue_line(self, line: str) -> Optional[tuple]:
+    def iter_issues(self, filepath: str) -> Iterator[MemoryIssue]:
         """
-        Try to match a line against known issue patterns.
+        Parse a Valgrind log file, yielding memory issues as they are found.
+        
+        Unlike ``parse_file`` the issues are not collected in a list, so a
+        consumer that aggregates them (e.g. ``IssueClassifier.calculate_statistics``)
+        only holds one issue at a time. While iterating, the parser keeps one
+        copy of each distinct stack frame line, released when iteration ends.
+        The log is parsed in-process, in order.
+        The file is validated when iteration starts.
         
         Args:
-            line: Line to match against patterns
+            filepath: Path to the Valgrind log file
             
-        Returns:
-            Tuple of (issue_type, bytes_count, blocks_count, loss_record) or None
+        Yields:
+            MemoryIssue objects in log order
+            
+        Raises:
+            LogParserError: If file cannot be read or is invalid format
         """
-        for issue_type, pattern in self._issue_patterns.items():
-            match = pattern.search(line)
-            if match:
-                if issue_type in [IssueType.INVALID_READ, IssueType.INVALID_WRITE]:
-                    # For invalid read/write, bytes are in first group, no blocks
-                    return (issue_type, int(match.group(1)), 1, "N/A")
-                else:
-                    # For memory leaks, extract bytes, blocks, and loss record
-                    # Remove commas from numbers before converting to int
-                    bytes_count = int(match.group(1).replace(',', ''))
-                    blocks_count = int(match.group(2).replace(',', ''))
-                    loss_record = match.group(3).strip()
-                    return (issue_type, bytes_count, blocks_count, loss_record)
-        
-        return None
+        self._validate_file(filepath)
+        
+        try:
+            with open(filepath, 'rb') as file:
+                with _map_log(file) as log:
+                    self._validate_valgrind_format(log)
+                    yield from self._iter_issues(log)
+                
+        except UnicodeDecodeError as e:
+            raise LogParserError(f"File encoding error: {e}")
+        except IOError as e:
+            raise LogParserError(f"Error reading file: {e}")
     
-    def _extract_stack_trace(self, lines: List[str], start_index: int) -> tuple:
+    def _parse_issues(self, log: _Log, start: int = 0, end: Optional[int] = None) -> List[MemoryIssue]:
         """
-        Extract stack trace information starting from the given index.
+        Parse memory issues from the whole log content.
         
         Args:
-            lines: All lines from the file
-            start_index: Index to start extracting stack trace
+            log: Raw log content (bytes or a memory-mapped file)
+            start: Offset of the first line to parse
+            end: Offset where parsing stops (default: end of the log)
             
         Returns:
-            Tuple of (stack_frames_list, lines_consumed)
+            List of MemoryIssue objects
         """
-        stack_frames = []
-        lines_consumed = 0
+        return list(self._iter_issues(log, start, end))
+    
+    def _iter_issues(self, log: _Log, start: int = 0, end: Optional[int] = None) -> Iterator[MemoryIssue]:
+        """
+        Generate memory issues from the log content.
         
-        for i in range(start_index, len(lines)):
-            line = lines[i].strip()
+        The regex engine scans from one issue line to the next, so lines that
+        are neither issues nor their stack frames are never visited in Python.
+        At most one issue is taken per line, and lines consumed as a stack
+        trace are not searched for issues.
+        
+        Args:
+            log: Raw log content (bytes or a memory-mapped file)
+            start: Offset of the first line to parse
+            end: Offset where parsing stops (default: end of the log)
             
-            # Stop if we hit an empty line or next issue
-            if not line or not line.startswith('=='):
+        Yields:
+            MemoryIssue objects in log order
+        """
+        if end is None:
+            end = len(log)
+        
+        search_issue = self._issue_pattern.search
+        pos = start
+        
+        # Identical frame lines (same PID, address and location) recur across
+        # traces; within one parse they share one raw line and, once parsed,
+        # one StackFrame. The raw lines are deduplicated only while scanning,
+        # and the frame cache is released with the last issue of this parse.
+        raw_frame_lines: Dict[bytes, bytes] = {}
+        parse_frame = _FrameParser()
+        
+        while True:
+            match = search_issue(log, pos, end)
+            if not match:
                 break
             
-            # Try to parse as stack frame
-            frame = self._parse_stack_frame(line)
-            if frame:
-                stack_frames.append(frame)
-                lines_consumed += 1
-            else:
-                # If it's not a stack frame but still a Valgrind line, continue
-                if line.startswith('==') and ('at 0x' in line or 'by 0x' in line):
-                    lines_consumed += 1
-                else:
-                    break
-        
-        return stack_frames, lines_consumed
+            issue_type, bytes_count, blocks_count, loss_record = self._issue_fields(match)
+            
+            # Extract stack trace starting from next line
+            line_end = log.find(b'\n', match.end(), end)
+            if line_end == -1:
+                line_end = end
+            raw_frames, source_location, pos = self._extract_stack_trace(
+                log, line_end + 1, end, raw_frame_lines
+            )
+            
+            yield MemoryIssue(
+                issue_type=issue_type,
+                bytes_count=bytes_count,
+                blocks_count=blocks_count,
+                loss_record=loss_record,
+                stack_trace=LazyStackTrace(raw_frames, parse_frame),
+                source_location=source_location
+            )
     
-    def _parse_stack_frame(self, line: str) -> Optional[StackFrame]:
+    def _issue_fields(self, match: re.Match) -> tuple:
         """
-        Parse a single stack frame line.
+        Extract the issue details from a match of the issue pattern.
         
         Args:
-            line: Line containing stack frame information
+            match: Match of the combined issue pattern
             
         Returns:
-            StackFrame object or None if line doesn't match pattern
+            Tuple of (issue_type, bytes_count, blocks_count, loss_record)
         """
-        match = self._stack_frame_pattern.search(line)
-        if not match:
-            return None
-        
-        function_info = match.group(1).strip()
-        location_info = match.group(2) if match.group(2) else ""
-        
-        # Extract address from the line
-        address_match = re.search(r'0x[0-9A-F]+', line)
-        address = address_match.group(0) if address_match else "unknown"
-        
-        # Parse function name and library from the function_info and location_info
-        function_name, library = self._parse_function_and_library(function_info, location_info)
-        
-        # Parse source file and line number from location_info
-        source_file, line_number = self._parse_location_info(location_info)
+        if match.group('size') is not None:
+            # For invalid read/write, bytes are the access size, no blocks
+            if match.group('invalid_read') is not None:
+                issue_type = IssueType.INVALID_READ
+            else:
+                issue_type = IssueType.INVALID_WRITE
+            return (issue_type, int(match.group('size')), 1, "N/A")
         
-        return StackFrame(
-            address=address,
-            function_name=function_name,
-            library=library,
-            source_file=source_file,
-            line_number=line_number
-        )
+        if match.group('definitely_lost') is not None:
+            issue_type = IssueType.DEFINITELY_LOST
+        elif match.group('possibly_lost') is not None:
+            issue_type = IssueType.POSSIBLY_LOST
+        else:
+            issue_type = IssueType.STILL_REACHABLE
+        
+        # For memory leaks, extract bytes, blocks, and loss record
+        # Delete thousands separators before converting to int
+        bytes_count = int(match.group('bytes').translate(None, b','))
+        blocks_count = int(match.group('blocks').translate(None, b','))
+        loss_record = match.group('record').decode(_LOG_ENCODING, 'replace').strip()
+        return (issue_type, bytes_count, blocks_count, loss_record)
     
-    def _parse_function_and_library(self, function_info: str, location_info: str) -> tuple:
+    def _extract_stack_trace(self, log: _Log, pos: int, end: int,
+                             raw_frame_lines: Dict[bytes, bytes]) -> tuple:
         """
-        Parse function name and library from function info and location info.
+        Extract stack trace information starting at the given offset.
+        
+        Frame lines are only matched here; they are turned into StackFrame
+        objects lazily (see LazyStackTrace). The most relevant source location
+        is taken from the frames' location info while scanning: the first
+        frame with both file and line number, else the first with a file.
         
         Args:
-            function_info: String containing function information
-            location_info: String containing location information (may include library)
+            log: Raw log content
+            pos: Offset of the first line of the stack trace
+            end: Offset where the parsed region ends
+            raw_frame_lines: Canonical copy of each distinct frame line seen
+                so far in this parse
             
         Returns:
-            Tuple of (function_name, library)
+            Tuple of (raw frame lines, source location or None, offset of the
+            first line after the trace)
         """
-        # Clean up function names that might have extra info
-        if function_info == "???":
-            function_name = "unknown"
-        else:
-            function_name = function_info
+        raw_frames = []
+        source_location = None
+        file_only_location = None
+        search_frame = _STACK_FRAME_PATTERN.search
+        shared_line = raw_frame_lines.setdefault
+        
+        while pos < end:
+            line_end = log.find(b'\n', pos, end)
+            if line_end == -1:
+                line_end = end
+            line = log[pos:line_end].strip()
+            
+            # Stop if we hit an empty line or next issue
+            if not line or not line.startswith(b'=='):
+                break
+            
+            # Frame lines always carry an address; without one the line can
+            # only end the trace, so skip the regex for it
+            if b'0x' not in line and b'0X' not in line:
+                break
+            
+            # Try to match as stack frame
+            match = search_frame(line)
+            if match:
+                raw_frames.append(shared_line(line, line))
+                if source_location is None and match.group(2):
+                    source_file, line_number = _parse_location_info(
+                        match.group(2).decode(_LOG_ENCODING, 'replace')
+                    )
+                    if source_file and line_number:
+                        source_location = f"{source_file}:{line_number}"
+                    elif source_file and file_only_location is None:
+                        file_only_location = source_file
+            elif not (b'at 0x' in line or b'by 0x' in line):
+                # Not a stack frame and not a Valgrind frame-like line either
+                break
+            
+            pos = line_end + 1
         
-        # Check if location_info contains library information (starts with "in ")
-        library = "unknown"
-        if location_info and location_info.startswith("in "):
-            library = location_info[3:].strip()  # Remove "in " prefix
+        # Many issues come from the same place; they share one location string
+        source_location = source_location or file_only_location
+        if source_location is not None:
+            source_location = sys.intern(source_location)
         
-        return function_name, library
+        return raw_frames, source_location, pos
+
+
+class _FrameParser:
+    """
+    Parses raw stack frame lines into StackFrame objects for one log parse.
+    
+    Frames are cached by their raw line, and their text fields are interned,
+    so repeated frames and names are stored once. The cache lives as long as
+    the stack traces of that parse that refer to this parser.
+    """
+    __slots__ = ("_frames",)
+    
+    def __init__(self):
+        self._frames: Dict[bytes, StackFrame] = {}
     
-    def _parse_location_info(self, location_info: str) -> tuple:
+    def __reduce__(self):
+        # The cache is rebuilt on demand; don't pickle the frames parsed so far
+        return (_FrameParser, ())
+    
+    def __call__(self, line: bytes) -> StackFrame:
         """
-        Parse source file and line number from location info.
+        Parse a single stack frame line.
         
         Args:
-            location_info: String containing location information
+            line: Raw line containing stack frame information, as collected
+                by ``LogParser._extract_stack_trace``
             
         Returns:
-            Tuple of (source_file, line_number)
+            StackFrame object
+            
+        Raises:
+            ValueError: If the line is not a stack frame line
         """
-        if not location_info:
-            return None, None
+        frame = self._frames.get(line)
+        if frame is not None:
+            return frame
         
-        # Skip library information (starts with "in ")
-        if location_info.startswith("in "):
-            return None, None
+        match = _STACK_FRAME_PATTERN.search(line)
+        if not match:
+            raise ValueError(f"Not a stack frame line: {line!r}")
         
-        # Look for pattern like "filename.cpp:123"
-        location_match = re.search(r'([^:]+):(\d+)$', location_info)
-        if location_match:
-            source_file = location_match.group(1).strip()
-            line_number = int(location_match.group(2))
-            return source_file, line_number
+        function_info = match.group(1).decode(_LOG_ENCODING, 'replace').strip()
+        location_info = match.group(2).decode(_LOG_ENCODING, 'replace') if match.group(2) else ""
         
-        # If no line number, might just be a file path
-        if location_info and location_info != "???":
-            return location_info, None
+        # Extract address from the line
+        address_match = _ADDRESS_PATTERN.search(line)
+        address = address_match.group(0).decode('ascii') if address_match else "unknown"
         
-        return None, None
+        # Parse function name and library from the function_info and location_info
+        function_name, library = _parse_function_and_library(function_info, location_info)
+        
+        # Parse source file and line number from location_info
+        source_file, line_number = _parse_location_info(location_info)
+        
+        frame = self._frames[line] = StackFrame(
+            address=address,
+            function_name=sys.intern(function_name),
+            library=sys.intern(library),
+            source_file=sys.intern(source_file) if source_file is not None else None,
+            line_number=line_number
+        )
+        return frame
+
+
+def _parse_function_and_library(function_info: str, location_info: str) -> tuple:
+    """
+    Parse function name and library from function info and location info.
     
-    def _get_source_location(self, stack_trace: List[StackFrame]) -> Optional[str]:
-        """
-        Get the most relevant source location from stack trace.
+    Args:
+        function_info: String containing function information
+        location_info: String containing location information (may include library)
         
-        Args:
-            stack_trace: List of stack frames
-            
-        Returns:
-            String representation of source location or None
-        """
-        # First pass: look for frames with both file and line number
-        for frame in stack_trace:
-            if frame.source_file and frame.line_number:
-                return f"{frame.source_file}:{frame.line_number}"
+    Returns:
+        Tuple of (function_name, library)
+    """
+    # Clean up function names that might have extra info
+    if function_info == "???":
+        function_name = "unknown"
+    else:
+        function_name = function_info
+    
+    # Check if location_info contains library information (starts with "in ")
+    library = "unknown"
+    if location_info and location_info.startswith("in "):
+        library = location_info[3:].strip()  # Remove "in " prefix
+    
+    return function_name, library
+
+
+def _parse_location_info(location_info: str) -> tuple:
+    """
+    Parse source file and line number from location info.
+    
+    Args:
+        location_info: String containing location information
         
-        # Second pass: look for frames with just file name
-        for frame in stack_trace:
-            if frame.source_file:
-                return frame.source_file
+    Returns:
+        Tuple of (source_file, line_number)
+    """
+    if not location_info:
+        return None, None
+    
+    # Skip library information (starts with "in ")
+    if location_info.startswith("in "):
+        return None, None
+    
+    # Look for pattern like "filename.cpp:123"
+    location_match = _FILE_LINE_PATTERN.search(location_info)
+    if location_match:
+        source_file = location_match.group(1).strip()
+        line_number = int(location_match.group(2))
+        return source_file, line_number
+    
+    # If no line number, might just be a file path
+    if location_info and location_info != "???":
+        return location_info, None
+    
+    return None, None
+
+
+def _parse_chunk(filepath: str, start: int, end: int) -> List[MemoryIssue]:
+    """
+    Parse one chunk of a log file in a worker process.
+    
+    Args:
+        filepath: Path to the Valgrind log file
+        start: Offset of the first line of the chunk
+        end: Offset where the chunk ends
+        
+    Returns:
+        List of MemoryIssue objects found in the chunk
+    """
+    with open(filepath, 'rb') as file:
+        with _map_log(file) as log:
+            return LogParser(max_workers=1)._parse_issues(log, start, end)
+
+
+def _map_log(file: BinaryIO) -> mmap.mmap:
+    """
+    Memory-map an open log file read-only for a front-to-back scan.
+    
+    Args:
+        file: Log file opened in binary mode
         
-        return None
\ No newline at end of file
+    Returns:
+        The read-only mapping of the whole file
+    """
+    log = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        # Let the OS read ahead aggressively and reclaim pages behind the scan
+        log.madvise(mmap.MADV_SEQUENTIAL)
+    return log
@@ -5,9 +5,12 @@ This module defines the core data structures used throughout the application
 for representing memory issues, stack traces, and analysis statistics.
 """
 
+import heapq
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
-from typing import List, Dict, Optional
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypedDict, Union, overload
 
 
 class IssueType(Enum):
@@ -21,6 +24,10 @@ class IssueType(Enum):
     OTHER = "other"
 
 
+# Bytes and blocks counts are packed into 48-bit fields of MemoryIssue._priority
+_PRIORITY_FIELD_MAX = (1 << 48) - 1
+
+
 class IssueSeverity(Enum):
     """Severity levels for memory issues."""
     CRITICAL = 1
@@ -30,9 +37,30 @@ class IssueSeverity(Enum):
     INFO = 5
 
 
-@dataclass
+# Default severity for each issue type
+_SEVERITY_BY_TYPE = {
+    IssueType.DEFINITELY_LOST: IssueSeverity.CRITICAL,
+    IssueType.POSSIBLY_LOST: IssueSeverity.HIGH,
+    IssueType.INVALID_READ: IssueSeverity.CRITICAL,
+    IssueType.INVALID_WRITE: IssueSeverity.CRITICAL,
+    IssueType.USE_AFTER_FREE: IssueSeverity.CRITICAL,
+    IssueType.STILL_REACHABLE: IssueSeverity.LOW,
+    IssueType.OTHER: IssueSeverity.MEDIUM,
+}
+
+# Severity field of MemoryIssue._priority, looked up instead of reading the
+# enum's value property for every issue
+_SEVERITY_PRIORITY = {severity: severity.value << 96 for severity in IssueSeverity}
+
+
+@dataclass(slots=True, frozen=True)
 class StackFrame:
-    """Represents a single frame in a stack trace."""
+    """
+    Represents a single frame in a stack trace.
+    
+    Frames are immutable because the log parser shares one instance between
+    every stack trace containing the same frame line.
+    """
     address: str
     function_name: str
     library: str
@@ -50,33 +78,148 @@ class StackFrame:
         return f"{self.function_name} [{self.library}]{location}"
 
 
-@dataclass
+class LazyStackTrace(Sequence):
+    """
+    Stack trace whose frames are parsed from their raw log lines on first access.
+    
+    Behaves like a read-only list of StackFrame objects. Each frame is parsed
+    at most once, and only when it is read, so consumers that look at the
+    first few frames (or only at the length) never parse the rest.
+    """
+    __slots__ = ("_raw_frames", "_frames", "_parse_frame")
+    
+    def __init__(self, raw_frames: List[Any], parse_frame: Callable[[Any], StackFrame]):
+        """
+        Initialize the stack trace.
+        
+        Args:
+            raw_frames: Raw stack frame lines, outermost call last
+            parse_frame: Function turning one raw line into a StackFrame
+        """
+        self._raw_frames = raw_frames
+        self._frames: List[Optional[StackFrame]] = [None] * len(raw_frames)
+        self._parse_frame = parse_frame
+    
+    def __len__(self) -> int:
+        return len(self._frames)
+    
+    @overload
+    def __getitem__(self, index: int) -> StackFrame: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[StackFrame]: ...
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[StackFrame, List[StackFrame]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._frames)))]
+        
+        frame = self._frames[index]
+        if frame is None:
+            frame = self._frames[index] = self._parse_frame(self._raw_frames[index])
+        return frame
+    
+    def __iter__(self) -> Iterator[StackFrame]:
+        frames = self._frames
+        for i, frame in enumerate(frames):
+            if frame is None:
+                frame = frames[i] = self._parse_frame(self._raw_frames[i])
+            yield frame
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyStackTrace)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(slots=True)
 class MemoryIssue:
     """Represents a memory issue detected by Valgrind."""
     issue_type: IssueType
     bytes_count: int
     blocks_count: int
     loss_record: str
-    stack_trace: List[StackFrame]
+    stack_trace: Sequence[StackFrame]  # a list, or a LazyStackTrace from the log parser
     source_location: Optional[str] = None
-    severity: IssueSeverity = IssueSeverity.MEDIUM
+    severity: Optional[IssueSeverity] = None  # None: derived from issue_type
     
     def __post_init__(self):
         """Post-initialization to set severity based on issue type."""
-        if self.severity == IssueSeverity.MEDIUM:  # Only set if not explicitly provided
-            severity_mapping = {
-                IssueType.DEFINITELY_LOST: IssueSeverity.CRITICAL,
-                IssueType.POSSIBLY_LOST: IssueSeverity.HIGH,
-                IssueType.INVALID_READ: IssueSeverity.CRITICAL,
-                IssueType.INVALID_WRITE: IssueSeverity.CRITICAL,
-                IssueType.USE_AFTER_FREE: IssueSeverity.CRITICAL,
-                IssueType.STILL_REACHABLE: IssueSeverity.LOW,
-                IssueType.OTHER: IssueSeverity.MEDIUM,
-            }
-            self.severity = severity_mapping.get(self.issue_type, IssueSeverity.MEDIUM)
+        if self.severity is None:  # Only set if not explicitly provided
+            self.severity = _SEVERITY_BY_TYPE.get(self.issue_type, IssueSeverity.MEDIUM)
+    
+    @property
+    def resolved_severity(self) -> IssueSeverity:
+        """
+        The issue's severity, typed as always set.
+        
+        ``severity`` is only None until ``__post_init__`` derives it from the
+        issue type, or if it is reset afterwards; it is derived again then.
+        """
+        severity = self.severity
+        if severity is None:
+            return _SEVERITY_BY_TYPE.get(self.issue_type, IssueSeverity.MEDIUM)
+        return severity
+    
+    def trace_summary(self) -> Tuple[str, str]:
+        """
+        Get the primary function and source location shown in reports.
+        
+        The primary function is the first frame with a resolved function name.
+        The source location is the issue's own, else the first frame with a
+        source file, as "file:line" or "file". Either is "Unknown" if nothing
+        provides it.
+        
+        Returns:
+            Tuple of (primary_function, source_location)
+        """
+        primary_function = next(
+            (frame.function_name for frame in self.stack_trace
+             if frame.function_name and frame.function_name != "???"),
+            "Unknown"
+        )
+        
+        source_location = self.source_location
+        if not source_location or source_location == "Unknown":
+            source_location = "Unknown"
+            for frame in self.stack_trace:
+                if frame.source_file:
+                    if frame.line_number:
+                        source_location = f"{frame.source_file}:{frame.line_number}"
+                    else:
+                        source_location = frame.source_file
+                    break
+        
+        return primary_function, source_location
+    
+    @property
+    def _priority(self) -> int:
+        """
+        Sort key packed into one int: lower values are higher priority.
+        
+        Severity first, then more bytes, then more blocks, so sorting compares
+        a single value per issue. Computed on each access, so it follows any
+        change to those fields. Counts are clamped to their 48-bit fields:
+        counts of 256 TiB and more rank equal, as do negative counts and 0.
+        """
+        bytes_count = min(max(self.bytes_count, 0), _PRIORITY_FIELD_MAX)
+        blocks_count = min(max(self.blocks_count, 0), _PRIORITY_FIELD_MAX)
+        return (
+            _SEVERITY_PRIORITY[self.resolved_severity]
+            | (_PRIORITY_FIELD_MAX - bytes_count) << 48
+            | (_PRIORITY_FIELD_MAX - blocks_count)
+        )
+
 
+class SeveritySummary(TypedDict):
+    """Number of issues of one severity level and their share of all issues."""
+    count: int
+    percentage: float
 
-@dataclass
+
+@dataclass(slots=True)
 class Statistics:
     """Aggregated statistics for memory issues analysis."""
     total_issues: int
@@ -85,9 +228,29 @@ class Statistics:
     issues_by_type: Dict[IssueType, int]
     bytes_by_type: Dict[IssueType, int]
     blocks_by_type: Dict[IssueType, int]
-    top_sources: List[str]
+    # Issue count per source: a source location, or a (function, library)
+    # tuple for the top stack frame when the location is unknown
+    source_counts: Dict[Union[str, tuple], int]
     severity_distribution: Dict[IssueSeverity, int]
     
+    def top_sources(self, limit: int = 10) -> List[str]:
+        """
+        Get the most frequent issue sources.
+        
+        Args:
+            limit: Maximum number of sources to return
+            
+        Returns:
+            Up to ``limit`` source names by descending count; equal counts
+            keep first-seen order
+        """
+        # Partial selection: only ``limit`` entries are kept ordered, not all N
+        ranked = heapq.nlargest(limit, self.source_counts.items(), key=itemgetter(1))
+        return [
+            key if isinstance(key, str) else f"{key[0]} ({key[1]})"
+            for key, _ in ranked
+        ]
+    
     def get_percentage_by_type(self) -> Dict[IssueType, float]:
         """Calculate percentage distribution of issues by type."""
         if self.total_issues == 0:
@@ -107,15 +270,90 @@ class Statistics:
             issue_type: (bytes_count / self.total_bytes_lost) * 100
             for issue_type, bytes_count in self.bytes_by_type.items()
         }
+    
+    def get_summary_by_severity(self) -> Dict[IssueSeverity, SeveritySummary]:
+        """Count and percentage of issues for every severity level."""
+        # Without issues every count is 0, so any non-zero divisor gives 0.0
+        total = self.total_issues or 1
+        distribution = self.severity_distribution
+        return {
+            severity: {'count': count, 'percentage': (count / total) * 100}
+            for severity in IssueSeverity
+            for count in (distribution.get(severity, 0),)
+        }
+    
+    def get_memory_leak_summary(self) -> Dict[str, Any]:
+        """Totals for memory leaks (excluding invalid reads/writes)."""
+        leak_types = [
+            IssueType.DEFINITELY_LOST,
+            IssueType.POSSIBLY_LOST,
+            IssueType.STILL_REACHABLE
+        ]
+        
+        total_leak_bytes = sum(
+            self.bytes_by_type.get(leak_type, 0)
+            for leak_type in leak_types
+        )
+        
+        total_leak_blocks = sum(
+            self.blocks_by_type.get(leak_type, 0)
+            for leak_type in leak_types
+        )
+        
+        total_leak_issues = sum(
+            self.issues_by_type.get(leak_type, 0)
+            for leak_type in leak_types
+        )
+        
+        return {
+            'total_leaked_bytes': total_leak_bytes,
+            'total_leaked_blocks': total_leak_blocks,
+            'total_leak_issues': total_leak_issues,
+            'leak_percentage_of_total': (
+                (total_leak_bytes / self.total_bytes_lost) * 100
+                if self.total_bytes_lost > 0 else 0
+            ),
+            'breakdown_by_type': {
+                'definitely_lost_bytes': self.bytes_by_type.get(IssueType.DEFINITELY_LOST, 0),
+                'possibly_lost_bytes': self.bytes_by_type.get(IssueType.POSSIBLY_LOST, 0),
+                'still_reachable_bytes': self.bytes_by_type.get(IssueType.STILL_REACHABLE, 0)
+            }
+        }
 
 
-@dataclass
+@dataclass(frozen=True)
 class ClassifiedIssues:
-    """Container for issues organized by classification."""
+    """
+    Container for issues organized by classification.
+    
+    Instances are immutable, so views derived from the statistics are
+    computed on first access and cached for every later report sheet.
+    The cached dicts are shared between callers and must not be modified.
+    """
     issues_by_type: Dict[IssueType, List[MemoryIssue]]
     statistics: Statistics
     all_issues: List[MemoryIssue]
     
+    @cached_property
+    def issues_percentage_by_type(self) -> Dict[IssueType, float]:
+        """Percentage distribution of issue count by type."""
+        return self.statistics.get_percentage_by_type()
+    
+    @cached_property
+    def bytes_percentage_by_type(self) -> Dict[IssueType, float]:
+        """Percentage distribution of bytes lost by type."""
+        return self.statistics.get_bytes_percentage_by_type()
+    
+    @cached_property
+    def summary_by_severity(self) -> Dict[IssueSeverity, SeveritySummary]:
+        """Count and percentage of issues for every severity level."""
+        return self.statistics.get_summary_by_severity()
+    
+    @cached_property
+    def memory_leak_summary(self) -> Dict[str, Any]:
+        """Totals for memory leaks (excluding invalid reads/writes)."""
+        return self.statistics.get_memory_leak_summary()
+    
     def get_critical_issues(self) -> List[MemoryIssue]:
         """Get all issues with critical severity."""
         return [
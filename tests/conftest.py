@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the Valgrind Log Analyzer tests.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The analyzer modules live in the repository root, not in a package
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+@pytest.fixture
+def sample_log() -> Path:
+    """Path to a small Valgrind log with one issue of each parsed type."""
+    return DATA_DIR / "sample.log"
@@ -0,0 +1,166 @@
+"""
+Tests for ExcelReporter.
+"""
+
+import gc
+
+import pytest
+from openpyxl import load_workbook
+
+from excel_reporter import ExcelReporter, ExcelReportError
+from issue_classifier import IssueClassifier
+from log_parser import LogParser
+
+
+@pytest.fixture
+def classified_issues(sample_log):
+    return IssueClassifier().classify_issues(LogParser().parse_file(str(sample_log)))
+
+
+def read_report(path) -> dict:
+    """Cell values and merged ranges of every sheet, by sheet name in order."""
+    workbook = load_workbook(path)
+    return {
+        worksheet.title: (
+            [list(row) for row in worksheet.iter_rows(values_only=True)],
+            sorted(str(cell_range) for cell_range in worksheet.merged_cells.ranges),
+        )
+        for worksheet in workbook.worksheets
+    }
+
+
+def read_formats(path) -> dict:
+    """Cell formats, column widths and row heights of every sheet, by sheet name."""
+    def cell_format(cell):
+        font, fill, border, alignment = cell.font, cell.fill, cell.border, cell.alignment
+        return (
+            bool(font.b), font.sz or 11.0,  # unset size is the default 11pt
+            fill.fill_type, fill.fgColor.rgb if fill.fill_type else None,
+            tuple(side.style for side in (border.left, border.right, border.top, border.bottom)),
+            alignment.horizontal, alignment.vertical, bool(alignment.wrap_text),
+            cell.number_format,
+        )
+
+    workbook = load_workbook(path)
+    formats = {}
+    for worksheet in workbook.worksheets:
+        default_height = worksheet.sheet_format.defaultRowHeight
+        formats[worksheet.title] = (
+            [[cell_format(cell) for cell in row] for row in worksheet.iter_rows()],
+            {column: dimension.width for column, dimension in worksheet.column_dimensions.items()
+             if dimension.customWidth},
+            [worksheet.row_dimensions[row].height or default_height
+             for row in range(1, worksheet.max_row + 1)],
+        )
+    return formats
+
+
+def test_report_has_summary_and_type_sheets(tmp_path, classified_issues):
+    path = tmp_path / "report.xlsx"
+    ExcelReporter().generate_report(classified_issues, str(path))
+
+    assert load_workbook(path).sheetnames == [
+        "Summary", "Definitely Lost", "Possibly Lost", "Still Reachable",
+        "Invalid Reads", "Invalid Writes", "Statistics",
+    ]
+
+
+def test_summary_totals(tmp_path, classified_issues):
+    path = tmp_path / "report.xlsx"
+    ExcelReporter().generate_report(classified_issues, str(path))
+
+    rows = read_report(path)["Summary"][0]
+
+    assert ["Total Issues:", 5, "Total Bytes Lost:", 3148] in rows
+    assert ["Total Blocks Lost:", 21, None, None] in rows
+
+
+def test_xlsxwriter_backend_writes_same_content(tmp_path, classified_issues):
+    pytest.importorskip("xlsxwriter")
+    openpyxl_path = tmp_path / "openpyxl.xlsx"
+    xlsxwriter_path = tmp_path / "xlsxwriter.xlsx"
+
+    ExcelReporter().generate_report(classified_issues, str(openpyxl_path))
+    ExcelReporter(backend="xlsxwriter").generate_report(classified_issues, str(xlsxwriter_path))
+
+    openpyxl_report = read_report(openpyxl_path)
+    xlsxwriter_report = read_report(xlsxwriter_path)
+    assert list(xlsxwriter_report) == list(openpyxl_report)
+    assert xlsxwriter_report == openpyxl_report
+
+
+def test_xlsxwriter_backend_writes_same_formats(tmp_path, classified_issues):
+    pytest.importorskip("xlsxwriter")
+    openpyxl_path = tmp_path / "openpyxl.xlsx"
+    xlsxwriter_path = tmp_path / "xlsxwriter.xlsx"
+
+    ExcelReporter().generate_report(classified_issues, str(openpyxl_path))
+    ExcelReporter(backend="xlsxwriter").generate_report(classified_issues, str(xlsxwriter_path))
+
+    openpyxl_formats = read_formats(openpyxl_path)
+    xlsxwriter_formats = read_formats(xlsxwriter_path)
+    for title, (cells, widths, heights) in openpyxl_formats.items():
+        xlsxwriter_cells, xlsxwriter_widths, xlsxwriter_heights = xlsxwriter_formats[title]
+        assert xlsxwriter_cells == cells, title
+        assert xlsxwriter_heights == heights, title
+        # xlsxwriter stores widths with Excel's cell padding added
+        assert xlsxwriter_widths == {column: pytest.approx(width, abs=1)
+                                     for column, width in widths.items()}, title
+
+
+def test_xlsxwriter_failure_leaves_no_file(tmp_path, classified_issues, monkeypatch):
+    pytest.importorskip("xlsxwriter")
+    path = tmp_path / "report.xlsx"
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(ExcelReporter, "_write_xlsxwriter_issue_type_sheet", fail)
+
+    with pytest.raises(ExcelReportError):
+        ExcelReporter(backend="xlsxwriter").generate_report(classified_issues, str(path))
+    assert not path.exists()
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ExcelReportError):
+        ExcelReporter(backend="csv")
+
+
+def test_empty_issues_rejected(tmp_path):
+    empty = IssueClassifier().classify_issues([])
+
+    with pytest.raises(ExcelReportError):
+        ExcelReporter().generate_report(empty, str(tmp_path / "report.xlsx"))
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_failed_save_closes_write_only_sheets(tmp_path, classified_issues):
+    # A directory where the file should go makes the save fail
+    path = tmp_path / "report.xlsx"
+    path.mkdir()
+
+    with pytest.raises(ExcelReportError):
+        ExcelReporter().generate_report(classified_issues, str(path))
+    gc.collect()
+
+
+def test_header_cells_use_header_named_style(tmp_path, classified_issues):
+    path = tmp_path / "report.xlsx"
+    ExcelReporter().generate_report(classified_issues, str(path))
+
+    worksheet = load_workbook(path)["Definitely Lost"]
+
+    assert [cell.style for cell in worksheet[5]] == ["header"] * 7
+    assert worksheet["A5"].font.bold
+
+
+def test_apply_header_style_on_standard_workbook():
+    reporter = ExcelReporter(streaming=False)
+    workbook = reporter.create_workbook()
+    worksheet = reporter.create_worksheet(workbook, "Sheet")
+    worksheet.append(["Name", "Count", "Bytes"])
+
+    reporter.apply_header_style(worksheet, 1)
+
+    assert [cell.style for cell in worksheet[1]] == ["header"] * 3
@@ -0,0 +1,139 @@
+"""
+Tests for IssueClassifier.
+"""
+
+from issue_classifier import IssueClassifier
+from models import IssueSeverity, IssueType, MemoryIssue, StackFrame
+
+
+def make_issue(issue_type, bytes_count, blocks_count, source_location=None,
+               stack_trace=(), severity=None):
+    return MemoryIssue(issue_type, bytes_count, blocks_count, "N/A", list(stack_trace),
+                       source_location=source_location, severity=severity)
+
+
+def baseline_order(issues) -> list:
+    return sorted(issues, key=lambda i: (i.severity.value, -i.bytes_count, -i.blocks_count))
+
+
+ISSUES = [
+    make_issue(IssueType.STILL_REACHABLE, 2048, 16, "pool.c:10"),
+    make_issue(IssueType.DEFINITELY_LOST, 64, 1, "cache.cpp:20"),
+    make_issue(IssueType.INVALID_READ, 4, 1, "reader.cpp:42"),
+    make_issue(IssueType.DEFINITELY_LOST, 64, 1, "cache.cpp:20"),  # ties the issue above
+    make_issue(IssueType.POSSIBLY_LOST, 512, 4, "pool.c:10"),
+    make_issue(IssueType.DEFINITELY_LOST, 1024, 2, "cache.cpp:20"),
+    make_issue(IssueType.DEFINITELY_LOST, 64, 3),
+    make_issue(IssueType.INVALID_WRITE, 8, 1, severity=IssueSeverity.MEDIUM),
+    make_issue(IssueType.POSSIBLY_LOST, 512, 4, "pool.c:10"),  # ties the other possibly lost
+]
+
+
+def test_all_issues_follow_baseline_priority_order():
+    classified = IssueClassifier().classify_issues(ISSUES)
+
+    # Identity, not equality: equal-priority issues keep their input order
+    assert [id(issue) for issue in classified.all_issues] == [id(issue) for issue in baseline_order(ISSUES)]
+
+
+def test_issues_are_bucketed_by_type_in_priority_order():
+    classified = IssueClassifier().classify_issues(ISSUES)
+
+    assert set(classified.issues_by_type) == {issue.issue_type for issue in ISSUES}
+    for issue_type, bucket in classified.issues_by_type.items():
+        expected = baseline_order(issue for issue in ISSUES if issue.issue_type == issue_type)
+        assert [id(issue) for issue in bucket] == [id(issue) for issue in expected]
+
+
+def test_statistics():
+    statistics = IssueClassifier().classify_issues(ISSUES).statistics
+
+    assert statistics.total_issues == 9
+    assert statistics.total_bytes_lost == 4300
+    assert statistics.total_blocks_lost == 33
+    assert statistics.issues_by_type[IssueType.DEFINITELY_LOST] == 4
+    assert statistics.bytes_by_type[IssueType.POSSIBLY_LOST] == 1024
+    assert statistics.blocks_by_type[IssueType.DEFINITELY_LOST] == 7
+    assert statistics.severity_distribution == {
+        IssueSeverity.CRITICAL: 5,
+        IssueSeverity.HIGH: 2,
+        IssueSeverity.MEDIUM: 1,
+        IssueSeverity.LOW: 1,
+    }
+
+
+def test_calculate_statistics_matches_classification():
+    classifier = IssueClassifier()
+
+    assert classifier.calculate_statistics(ISSUES) == classifier.classify_issues(ISSUES).statistics
+    assert classifier.calculate_statistics(iter(ISSUES)) == classifier.classify_issues(ISSUES).statistics
+
+
+def test_top_sources_formats_frame_keys():
+    frames = [StackFrame("0x1", "Cache::grow()", "libcache.so"), StackFrame("0x2", "main", "app")]
+    issues = [
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, stack_trace=frames),
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, "cache.cpp:20"),
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, stack_trace=frames),
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, "pool.c:10"),
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, "cache.cpp:20"),
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, stack_trace=frames),
+        # Neither a location nor a known top frame: not counted
+        make_issue(IssueType.DEFINITELY_LOST, 8, 1, stack_trace=[StackFrame("0x3", "unknown", "app")]),
+    ]
+
+    statistics = IssueClassifier().calculate_statistics(issues)
+
+    assert statistics.source_counts == {
+        ("Cache::grow()", "libcache.so"): 3, "cache.cpp:20": 2, "pool.c:10": 1,
+    }
+    assert statistics.top_sources() == ["Cache::grow() (libcache.so)", "cache.cpp:20", "pool.c:10"]
+    assert statistics.top_sources(2) == ["Cache::grow() (libcache.so)", "cache.cpp:20"]
+
+
+def test_top_sources_keep_first_seen_order_on_ties():
+    statistics = IssueClassifier().calculate_statistics(ISSUES)
+
+    assert statistics.top_sources(1) == ["pool.c:10"]
+    assert statistics.top_sources() == ["pool.c:10", "cache.cpp:20", "reader.cpp:42"]
+
+
+def test_detailed_source_analysis():
+    frames = [StackFrame("0x1", "Cache::grow()", "libcache.so")]
+    issues = ISSUES + [make_issue(IssueType.STILL_REACHABLE, 16, 2, stack_trace=frames)]
+
+    analysis = IssueClassifier().get_detailed_source_analysis(issues)
+
+    assert set(analysis) == {"pool.c:10", "cache.cpp:20", "reader.cpp:42",
+                             "Cache::grow() (libcache.so)", "Unknown"}
+    pool = analysis["pool.c:10"]
+    assert (pool["count"], pool["total_bytes"], pool["total_blocks"]) == (3, 3072, 24)
+    assert sorted(pool["issue_types"]) == ["possibly_lost", "still_reachable"]
+    assert sorted(pool["severities"]) == [IssueSeverity.HIGH.value, IssueSeverity.LOW.value]
+    assert analysis["Unknown"]["count"] == 2
+    assert analysis["Cache::grow() (libcache.so)"]["issue_types"] == ["still_reachable"]
+
+
+def test_empty_list():
+    classified = IssueClassifier().classify_issues([])
+
+    assert classified.all_issues == []
+    assert classified.issues_by_type == {}
+    assert classified.statistics.total_issues == 0
+
+
+def test_empty_generator():
+    # A generator is always truthy, so it takes the aggregation path
+    classified = IssueClassifier().classify_issues(issue for issue in [])
+
+    assert classified.all_issues == []
+    assert classified.issues_by_type == {}
+    assert classified.statistics == IssueClassifier().calculate_statistics([])
+
+
+def test_generator_input_matches_list_input():
+    classifier = IssueClassifier()
+
+    from_generator = classifier.classify_issues(issue for issue in ISSUES)
+
+    assert from_generator == classifier.classify_issues(ISSUES)
@@ -0,0 +1,148 @@
+"""
+Tests for LogParser.
+"""
+
+import pytest
+
+from log_parser import LogParser, LogParserError, _CHUNK_BOUNDARY_PATTERN, _parse_chunk
+from models import IssueSeverity, IssueType, StackFrame
+
+
+def frame(function_name: str, source_file=None, line_number=None, library: str = "unknown") -> tuple:
+    """Expected (function, library, source file, line) of a parsed frame."""
+    return (function_name, library, source_file, line_number)
+
+
+def frame_fields(stack_frame: StackFrame) -> tuple:
+    """The fields of a parsed frame compared against ``frame``."""
+    return (stack_frame.function_name, stack_frame.library,
+            stack_frame.source_file, stack_frame.line_number)
+
+
+EXPECTED_ISSUES = [
+    (IssueType.INVALID_READ, 4, 1, "N/A", "reader.cpp:42", [
+        frame("Reader::next()", "reader.cpp", 42),
+        frame("main", "main.cpp", 17),
+    ]),
+    (IssueType.INVALID_WRITE, 8, 1, "N/A", "writer.cpp", [
+        frame("Writer::flush()", "writer.cpp"),
+        frame("unknown", library="/usr/lib/libwriter.so"),
+    ]),
+    (IssueType.DEFINITELY_LOST, 1024, 2, "3 of 4", "vg_replace_malloc.c:299", [
+        frame("malloc", "vg_replace_malloc.c", 299),
+        frame("Cache::grow()", "cache.cpp"),
+        frame("main", "main.cpp", 30),
+    ]),
+    (IssueType.POSSIBLY_LOST, 64, 1, "2 of 4", "vg_replace_malloc.c:711", [
+        frame("calloc", "vg_replace_malloc.c", 711),
+        frame("unknown", library="/usr/lib/libfoo.so.1"),
+    ]),
+    (IssueType.STILL_REACHABLE, 2048, 16, "4 of 4", "vg_replace_malloc.c:299", [
+        frame("malloc", "vg_replace_malloc.c", 299),
+        frame("main", "main.cpp", 50),
+    ]),
+]
+
+
+def test_parse_file_matches_fixture(sample_log):
+    issues = LogParser().parse_file(str(sample_log))
+
+    assert [
+        (issue.issue_type, issue.bytes_count, issue.blocks_count, issue.loss_record,
+         issue.source_location, [frame_fields(f) for f in issue.stack_trace])
+        for issue in issues
+    ] == EXPECTED_ISSUES
+
+
+def test_parse_file_derives_severity(sample_log):
+    issues = LogParser().parse_file(str(sample_log))
+
+    assert [issue.severity for issue in issues] == [
+        IssueSeverity.CRITICAL, IssueSeverity.CRITICAL, IssueSeverity.CRITICAL,
+        IssueSeverity.HIGH, IssueSeverity.LOW,
+    ]
+
+
+def test_frame_addresses_are_kept(sample_log):
+    issue = LogParser().parse_file(str(sample_log))[0]
+
+    assert [f.address for f in issue.stack_trace] == ["0x4005F4", "0x400712"]
+
+
+def test_line_without_address_ends_stack_trace(sample_log):
+    # "at malloc (...)" has no 0x address: the possibly-lost trace stops
+    # before it, and the frame after it is not attached to any issue
+    issues = LogParser().parse_file(str(sample_log))
+    possibly_lost = issues[3]
+
+    assert len(possibly_lost.stack_trace) == 2
+    assert all(f.line_number != 40 for issue in issues for f in issue.stack_trace)
+
+
+def test_frame_like_line_is_skipped_without_ending_trace(sample_log):
+    # "by 0x4007B0:" has no function; it is skipped, not a trace terminator
+    still_reachable = LogParser().parse_file(str(sample_log))[4]
+
+    assert [f.function_name for f in still_reachable.stack_trace] == ["malloc", "main"]
+
+
+def test_identical_frame_lines_share_one_frame(sample_log):
+    issues = LogParser().parse_file(str(sample_log))
+
+    assert issues[2].stack_trace[0] is issues[4].stack_trace[0]
+
+
+def test_iter_issues_matches_parse_file(sample_log):
+    parser = LogParser()
+
+    assert list(parser.iter_issues(str(sample_log))) == parser.parse_file(str(sample_log))
+
+
+def test_rejects_non_valgrind_file(tmp_path):
+    path = tmp_path / "plain.log"
+    path.write_text("just some program output\n")
+
+    with pytest.raises(LogParserError):
+        LogParser().parse_file(str(path))
+
+
+def test_rejects_missing_file(tmp_path):
+    with pytest.raises(LogParserError):
+        LogParser().parse_file(str(tmp_path / "missing.log"))
+
+
+@pytest.fixture
+def repeated_log(tmp_path, sample_log):
+    """A log holding the fixture's issues many times over, from several PIDs."""
+    text = sample_log.read_text()
+    path = tmp_path / "repeated.log"
+    path.write_text("".join(text.replace("==1234==", f"=={pid}==") for pid in range(1000, 1050)))
+    return path
+
+
+def test_chunks_split_at_boundaries_parse_like_whole_log(repeated_log):
+    log = repeated_log.read_bytes()
+    starts = [match.start() for match in _CHUNK_BOUNDARY_PATTERN.finditer(log)]
+    bounds = [0] + starts + [len(log)]
+
+    chunked = []
+    for start, end in zip(bounds, bounds[1:]):
+        chunked.extend(_parse_chunk(str(repeated_log), start, end))
+
+    assert len(starts) > 100
+    assert chunked == LogParser()._parse_issues(log)
+
+
+def test_parallel_parse_matches_in_process_parse(repeated_log):
+    log = repeated_log.read_bytes()
+
+    parallel = LogParser(max_workers=3)._parse_issues_parallel(str(repeated_log), log)
+
+    assert parallel == LogParser()._parse_issues(log)
+    assert len(parallel) == 5 * 50
+
+
+@pytest.mark.parametrize("max_workers", [0, -2])
+def test_rejects_fewer_than_one_worker(max_workers):
+    with pytest.raises(ValueError):
+        LogParser(max_workers=max_workers)
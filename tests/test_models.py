@@ -0,0 +1,183 @@
+"""
+Tests for the data models.
+"""
+
+import pickle
+
+import pytest
+
+from log_parser import LogParser
+from models import IssueSeverity, IssueType, LazyStackTrace, MemoryIssue, StackFrame
+
+
+FRAMES = [
+    StackFrame("0x1", "malloc", "unknown", "vg_replace_malloc.c", 299),
+    StackFrame("0x2", "Cache::grow()", "unknown", "cache.cpp"),
+    StackFrame("0x3", "main", "unknown", "main.cpp", 30),
+]
+
+
+class CountingParser:
+    """Frame parser that looks frames up by index and counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw: int) -> StackFrame:
+        self.calls += 1
+        return FRAMES[raw]
+
+
+def lazy_trace():
+    parser = CountingParser()
+    return LazyStackTrace(list(range(len(FRAMES))), parser), parser
+
+
+def test_len_does_not_parse_frames():
+    trace, parser = lazy_trace()
+
+    assert len(trace) == 3
+    assert parser.calls == 0
+
+
+def test_indexing_parses_each_frame_once():
+    trace, parser = lazy_trace()
+
+    assert trace[0] == FRAMES[0]
+    assert trace[-1] == FRAMES[2]
+    assert trace[0] is trace[0]
+    assert parser.calls == 2
+
+
+def test_index_out_of_range():
+    trace, _ = lazy_trace()
+
+    with pytest.raises(IndexError):
+        trace[3]
+
+
+def test_slicing_returns_list():
+    trace, parser = lazy_trace()
+
+    assert trace[:2] == FRAMES[:2]
+    assert trace[::-1] == FRAMES[::-1]
+    assert trace[5:] == []
+    assert parser.calls == 3
+
+
+def test_iteration_and_reuse_of_parsed_frames():
+    trace, parser = lazy_trace()
+    first = trace[1]
+
+    assert list(trace) == FRAMES
+    assert list(trace)[1] is first
+    assert parser.calls == 3
+
+
+def test_equality_with_lists_and_other_traces():
+    trace, _ = lazy_trace()
+    other, _ = lazy_trace()
+
+    assert trace == FRAMES
+    assert trace == other
+    assert trace != FRAMES[:2]
+    assert trace != tuple(FRAMES)
+
+
+def test_issue_with_lazy_trace_equals_issue_with_list():
+    trace, _ = lazy_trace()
+
+    lazy = MemoryIssue(IssueType.DEFINITELY_LOST, 10, 1, "1 of 1", trace)
+    plain = MemoryIssue(IssueType.DEFINITELY_LOST, 10, 1, "1 of 1", list(FRAMES))
+
+    assert lazy == plain
+
+
+def test_severity_derived_unless_given():
+    derived = MemoryIssue(IssueType.DEFINITELY_LOST, 10, 1, "1 of 1", [])
+    explicit = MemoryIssue(IssueType.DEFINITELY_LOST, 10, 1, "1 of 1", [],
+                           severity=IssueSeverity.MEDIUM)
+
+    assert derived.severity == IssueSeverity.CRITICAL
+    assert explicit.severity == IssueSeverity.MEDIUM
+
+
+def test_resolved_severity_derives_reset_severity():
+    issue = MemoryIssue(IssueType.STILL_REACHABLE, 10, 1, "1 of 1", [],
+                        severity=IssueSeverity.HIGH)
+
+    assert issue.resolved_severity == IssueSeverity.HIGH
+    issue.severity = None
+    assert issue.resolved_severity == IssueSeverity.LOW
+
+
+def test_priority_orders_by_severity_then_bytes_then_blocks():
+    issues = [
+        MemoryIssue(IssueType.STILL_REACHABLE, 4096, 1, "", []),
+        MemoryIssue(IssueType.DEFINITELY_LOST, 8, 1, "", []),
+        MemoryIssue(IssueType.DEFINITELY_LOST, 8, 2, "", []),
+        MemoryIssue(IssueType.DEFINITELY_LOST, 64, 1, "", []),
+    ]
+
+    ranked = sorted(issues, key=lambda issue: issue._priority)
+
+    assert ranked == [issues[3], issues[2], issues[1], issues[0]]
+
+
+def test_priority_follows_field_changes():
+    small = MemoryIssue(IssueType.DEFINITELY_LOST, 8, 1, "", [])
+    large = MemoryIssue(IssueType.DEFINITELY_LOST, 64, 1, "", [])
+
+    small.bytes_count = 128
+
+    assert small._priority < large._priority
+
+
+def test_priority_orders_large_counts():
+    issues = [
+        MemoryIssue(IssueType.DEFINITELY_LOST, 1 << 40, 1, "", []),
+        MemoryIssue(IssueType.DEFINITELY_LOST, (1 << 40) + 1, 1, "", []),
+        MemoryIssue(IssueType.DEFINITELY_LOST, 64, 1 << 41, "", []),
+        MemoryIssue(IssueType.POSSIBLY_LOST, 1 << 45, 1, "", []),
+    ]
+
+    ranked = sorted(issues, key=lambda issue: issue._priority)
+
+    assert ranked == [issues[1], issues[0], issues[2], issues[3]]
+
+
+def test_priority_saturates_counts_outside_packed_range():
+    def priority(bytes_count, blocks_count=1):
+        return MemoryIssue(IssueType.DEFINITELY_LOST, bytes_count, blocks_count, "", [])._priority
+
+    assert priority(1 << 60) == priority(1 << 48) < priority((1 << 48) - 2)
+    assert priority(-5) == priority(0) > priority(1)
+    assert priority(8, 1 << 50) == priority(8, 1 << 48) < priority(8, 1)
+
+
+def test_pickled_parsed_issue_keeps_frames_not_parser_cache(sample_log):
+    issues = LogParser().parse_file(str(sample_log))
+    for issue in issues:
+        list(issue.stack_trace)
+
+    restored = pickle.loads(pickle.dumps(issues[0]))
+
+    assert restored == issues[0]
+    assert len(pickle.dumps(issues[0])) < 1024
+
+
+@pytest.mark.parametrize("source_location", [None, "", "Unknown"])
+def test_trace_summary_falls_back_to_frames(source_location):
+    frames = [StackFrame("0x0", "???", "unknown")] + FRAMES[1:]
+    issue = MemoryIssue(IssueType.DEFINITELY_LOST, 10, 1, "1 of 1", frames,
+                        source_location=source_location)
+
+    assert issue.trace_summary() == ("Cache::grow()", "cache.cpp")
+
+
+def test_trace_summary_keeps_own_location():
+    issue = MemoryIssue(IssueType.DEFINITELY_LOST, 10, 1, "1 of 1", FRAMES,
+                        source_location="pool.c:7")
+
+    assert issue.trace_summary() == ("malloc", "pool.c:7")
+    assert MemoryIssue(IssueType.OTHER, 0, 0, "N/A", []).trace_summary() == ("Unknown", "Unknown")
@@ -0,0 +1,135 @@
+"""
+Tests for the command line helpers in valgrind_analyzer.
+"""
+
+import argparse
+import csv
+
+import pytest
+from openpyxl import load_workbook
+
+from issue_classifier import IssueClassifier
+from log_parser import LogParser
+from models import IssueType, MemoryIssue, StackFrame
+from valgrind_analyzer import export_to_csv, filter_issues_by_module, write_report
+
+
+def read_csv(path) -> list:
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        return list(csv.reader(csvfile))
+
+
+def test_export_to_csv_writes_issues_by_priority(tmp_path, sample_log):
+    classified = IssueClassifier().classify_issues(LogParser().parse_file(str(sample_log)))
+    path = tmp_path / "report.csv"
+
+    export_to_csv(classified, str(path))
+
+    assert read_csv(path) == [
+        ["Issue Type", "Severity", "Bytes", "Blocks", "Loss Record", "Primary Function", "Source Location"],
+        ["Definitely Lost", "CRITICAL", "1024", "2", "3 of 4", "malloc", "vg_replace_malloc.c:299"],
+        ["Invalid Write", "CRITICAL", "8", "1", "N/A", "Writer::flush()", "writer.cpp"],
+        ["Invalid Read", "CRITICAL", "4", "1", "N/A", "Reader::next()", "reader.cpp:42"],
+        ["Possibly Lost", "HIGH", "64", "1", "2 of 4", "calloc", "vg_replace_malloc.c:711"],
+        ["Still Reachable", "LOW", "2048", "16", "4 of 4", "malloc", "vg_replace_malloc.c:299"],
+    ]
+
+
+def test_export_to_csv_falls_back_to_stack_frames(tmp_path):
+    issues = [
+        MemoryIssue(IssueType.DEFINITELY_LOST, 16, 1, "1 of 2", [
+            StackFrame("0x1", "???", "unknown"),
+            StackFrame("0x2", "alloc_buffer", "unknown", "buffer.c"),
+            StackFrame("0x3", "main", "unknown", "main.c", 12),
+        ]),
+        MemoryIssue(IssueType.STILL_REACHABLE, 8, 1, "2 of 2", []),
+    ]
+    path = tmp_path / "report.csv"
+
+    export_to_csv(IssueClassifier().classify_issues(issues), str(path))
+
+    assert read_csv(path)[1:] == [
+        ["Definitely Lost", "CRITICAL", "16", "1", "1 of 2", "alloc_buffer", "buffer.c"],
+        ["Still Reachable", "LOW", "8", "1", "2 of 2", "Unknown", "Unknown"],
+    ]
+
+
+def module_issues() -> list:
+    return [
+        MemoryIssue(IssueType.DEFINITELY_LOST, 16, 1, "1 of 4", [
+            StackFrame("0x1", "malloc", "vgpreload_memcheck.so"),
+            StackFrame("0x2", "DConfigWatcher::start()", "libdconfig.so", "watcher.cpp", 12),
+        ]),
+        MemoryIssue(IssueType.DEFINITELY_LOST, 16, 1, "2 of 4", [
+            StackFrame("0x1", "malloc", "vgpreload_memcheck.so"),
+            StackFrame("0x3", "Dcc::Plugin::load()", "libdcc-core.so"),
+        ]),
+        MemoryIssue(IssueType.INVALID_READ, 4, 1, "N/A", [
+            StackFrame("0x4", "???", "unknown"),
+        ], source_location="network/socket.c:88"),
+        MemoryIssue(IssueType.STILL_REACHABLE, 8, 1, "4 of 4", [
+            StackFrame("0x1", "malloc", "vgpreload_memcheck.so"),
+        ]),
+    ]
+
+
+def test_filter_keeps_issues_matching_any_module():
+    issues = module_issues()
+
+    assert filter_issues_by_module(issues, "dconfig,dcc-core") == issues[:2]
+    assert filter_issues_by_module(issues, "watcher.cpp") == issues[:1]
+
+
+def test_filter_is_case_insensitive():
+    issues = module_issues()
+
+    assert filter_issues_by_module(issues, "DCONFIGWATCHER") == issues[:1]
+    assert filter_issues_by_module(issues, " Dcc::plugin ") == issues[1:2]
+
+
+def test_filter_ignores_blank_entries():
+    issues = module_issues()
+
+    assert filter_issues_by_module(issues, "dcc-core,,") == issues[1:2]
+    assert filter_issues_by_module(issues, " , ") == issues
+
+
+def test_filter_matches_source_location_only():
+    issues = module_issues()
+
+    assert filter_issues_by_module(issues, "socket.c") == issues[2:3]
+
+
+def report_args(output, module=None, csv_fallback=False) -> argparse.Namespace:
+    return argparse.Namespace(output=str(output), module=module,
+                              csv_fallback=csv_fallback, low_memory=False)
+
+
+def test_write_report_adds_sanitized_module_to_file_name(tmp_path, sample_log):
+    classified = IssueClassifier().classify_issues(LogParser().parse_file(str(sample_log)))
+
+    write_report(classified, report_args(tmp_path / "report.xlsx", module="a,b/c"))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["report_a_b_c.xlsx"]
+    assert load_workbook(tmp_path / "report_a_b_c.xlsx").sheetnames[0] == "Summary"
+
+
+def test_write_report_falls_back_to_csv(tmp_path, sample_log):
+    classified = IssueClassifier().classify_issues(LogParser().parse_file(str(sample_log)))
+    # A directory where the workbook should go makes the Excel report fail
+    (tmp_path / "report_a_b_c.xlsx").mkdir()
+
+    write_report(classified, report_args(tmp_path / "report.xlsx", module="a,b/c", csv_fallback=True))
+
+    assert len(read_csv(tmp_path / "report_a_b_c.csv")) == 6
+
+
+def test_write_report_exits_without_csv_fallback(tmp_path, sample_log):
+    classified = IssueClassifier().classify_issues(LogParser().parse_file(str(sample_log)))
+    (tmp_path / "report.xlsx").mkdir()
+
+    with pytest.raises(SystemExit) as excinfo:
+        write_report(classified, report_args(tmp_path / "report.xlsx"))
+
+    assert excinfo.value.code == 1
+    assert not (tmp_path / "report.csv").exists()
@@ -10,14 +10,22 @@ import sys
 import argparse
 import csv
 import logging
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 import time
 
-from models import MemoryIssue, ClassifiedIssues, IssueType
+from models import MemoryIssue, ClassifiedIssues, IssueType, IssueSeverity, StackFrame
 from log_parser import LogParser, LogParserError
 from issue_classifier import IssueClassifier
-from excel_reporter import ExcelReporter, ExcelReportError
+
+
+# Write buffer for CSV export, so large reports reach the disk in few writes
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Runs of characters not kept when a module filter is added to a file name,
+# e.g. the commas between several modules
+_FILENAME_UNSAFE_PATTERN = re.compile(r'[^\w.-]+')
 
 
 def filter_issues_by_module(issues: List[MemoryIssue], module_filter: str) -> List[MemoryIssue]:
@@ -26,44 +34,57 @@ def filter_issues_by_module(issues: List[MemoryIssue], module_filter: str) -> Li
     
     Args:
         issues: List of all memory issues
-        module_filter: Module name to filter by (case-insensitive)
+        module_filter: Module name to filter by, or several separated by
+            commas to keep issues related to any of them (case-insensitive)
         
     Returns:
         Filtered list of memory issues
     """
-    if not module_filter:
+    modules = [module.strip().lower() for module in module_filter.split(",")]
+    modules = [module for module in modules if module]
+    if not modules:
         return issues
     
     filtered_issues = []
-    module_filter_lower = module_filter.lower()
+    
+    # One alternation finds any of the module names in a single scan of each
+    # lowercased name, however many modules are given
+    contains_module = re.compile("|".join(map(re.escape, modules))).search
+    
+    # Frames are hashable values, so each distinct frame is checked only once
+    # however many traces contain it; source locations repeat the same way
+    frame_matches: Dict[StackFrame, bool] = {}
+    location_matches: Dict[str, bool] = {}
     
     for issue in issues:
         # Check if any stack frame contains the module name
         module_found = False
         
-        # Check in function names
         for frame in issue.stack_trace:
-            if (frame.function_name and 
-                module_filter_lower in frame.function_name.lower()):
-                module_found = True
-                break
-            
-            # Check in library names
-            if (frame.library and 
-                module_filter_lower in frame.library.lower()):
-                module_found = True
-                break
-            
-            # Check in source file names
-            if (frame.source_file and 
-                module_filter_lower in frame.source_file.lower()):
+            found = frame_matches.get(frame)
+            if found is None:
+                # Check in function, library and source file names
+                found = frame_matches[frame] = bool(
+                    (frame.function_name and
+                     contains_module(frame.function_name.lower()))
+                    or (frame.library and
+                        contains_module(frame.library.lower()))
+                    or (frame.source_file and
+                        contains_module(frame.source_file.lower()))
+                )
+            if found:
                 module_found = True
                 break
         
         # Also check the main source location
-        if (not module_found and issue.source_location and 
-            module_filter_lower in issue.source_location.lower()):
-            module_found = True
+        if not module_found and issue.source_location:
+            location = issue.source_location
+            found = location_matches.get(location)
+            if found is None:
+                found = location_matches[location] = bool(
+                    contains_module(location.lower())
+                )
+            module_found = found
         
         if module_found:
             filtered_issues.append(issue)
@@ -79,7 +100,8 @@ def export_to_csv(classified_issues: ClassifiedIssues, output_path: str) -> None
         classified_issues: The analyzed and classified memory issues data
         output_path: Path where the CSV file should be saved
     """
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(output_path, 'w', newline='', encoding='utf-8',
+              buffering=_CSV_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         
         # Write header
@@ -88,36 +110,47 @@ def export_to_csv(classified_issues: ClassifiedIssues, output_path: str) -> None
             'Loss Record', 'Primary Function', 'Source Location'
         ])
         
-        # Write data rows
-        for issue in classified_issues.all_issues:
-            # Get primary function from stack trace
-            primary_function = "Unknown"
-            if issue.stack_trace:
-                for frame in issue.stack_trace:
-                    if frame.function_name and frame.function_name != "???":
-                        primary_function = frame.function_name
-                        break
-            
-            # Get source location
-            source_location = issue.source_location or "Unknown"
-            if source_location == "Unknown" and issue.stack_trace:
-                for frame in issue.stack_trace:
-                    if frame.source_file:
-                        if frame.line_number:
-                            source_location = f"{frame.source_file}:{frame.line_number}"
-                        else:
-                            source_location = frame.source_file
-                        break
-            
-            writer.writerow([
-                issue.issue_type.value.replace("_", " ").title(),
-                issue.severity.name,
+        # Type and severity labels are formatted once, not per row
+        type_labels = {
+            issue_type: issue_type.value.replace("_", " ").title()
+            for issue_type in IssueType
+        }
+        severity_labels = {severity: severity.name for severity in IssueSeverity}
+        
+        # Write data rows, generated as the writer consumes them
+        writer.writerows(
+            (
+                type_labels[issue.issue_type],
+                severity_labels[issue.resolved_severity],
                 issue.bytes_count,
                 issue.blocks_count,
                 issue.loss_record,
-                primary_function,
-                source_location
-            ])
+                *issue.trace_summary()
+            )
+            for issue in classified_issues.all_issues
+        )
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a command line value that must be a whole number of at least 1.
+    
+    Args:
+        value: The command line value
+        
+    Returns:
+        The parsed number
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a number of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a whole number of at least 1, got '{value}'")
+    return number
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -134,6 +167,67 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def write_report(classified_issues: ClassifiedIssues, args: argparse.Namespace) -> None:
+    """
+    Generate the Excel report, falling back to CSV if requested.
+    
+    The Excel reporter is imported here rather than at module level: loading
+    openpyxl dominates start-up, and runs that stop before writing a report
+    (no issues found, parse errors) or only use the helpers above never need it.
+    
+    Args:
+        classified_issues: Classified issues to report
+        args: Parsed command line arguments
+    """
+    from excel_reporter import ExcelReporter, ExcelReportError
+    
+    # The module filter goes into the output file names, with separators
+    # and path characters replaced so it stays a single file name
+    module_suffix = ""
+    if args.module:
+        module_suffix = _FILENAME_UNSAFE_PATTERN.sub('_', args.module).strip('_')
+    
+    try:
+        if args.low_memory:
+            try:
+                reporter = ExcelReporter(backend="xlsxwriter")
+            except ExcelReportError as e:
+                # openpyxl reports are streamed too, just with higher overhead
+                logging.warning(f"{e}; using openpyxl write-only mode instead")
+                reporter = ExcelReporter()
+        else:
+            reporter = ExcelReporter()
+        
+        logging.info("Generating Excel report...")
+        try:
+            # Adjust output filename if module filter is applied
+            output_path = args.output
+            if module_suffix:
+                output_path = args.output.replace('.xlsx', f'_{module_suffix}.xlsx')
+            
+            reporter.generate_report(classified_issues, output_path)
+            print(f"Excel report generated successfully: {output_path}")
+            
+        except ExcelReportError as e:
+            if args.csv_fallback:
+                print(f"Excel generation failed: {e}")
+                print("Attempting CSV fallback...")
+                csv_output = args.output.replace('.xlsx', '.csv')
+                if module_suffix:
+                    # Add module name to CSV filename
+                    csv_output = csv_output.replace('.csv', f'_{module_suffix}.csv')
+                export_to_csv(classified_issues, csv_output)
+                print(f"CSV report generated: {csv_output}")
+            else:
+                raise
+        
+    except ExcelReportError as e:
+        print(f"Error generating report: {e}", file=sys.stderr)
+        if not args.csv_fallback:
+            print("Use --csv-fallback option to generate CSV output instead", file=sys.stderr)
+        sys.exit(1)
+
+
 def main() -> None:
     """
     Main entry point for the Valgrind log analyzer.
@@ -162,7 +256,18 @@ def main() -> None:
     )
     parser.add_argument(
         "-m", "--module",
-        help="Filter issues by module/component name (e.g., 'dcc', 'DConfigWatcher'). Only shows issues with stack traces containing this module."
+        help="Filter issues by module/component name (e.g., 'dcc', 'DConfigWatcher'). Only shows issues with stack traces containing this module. Separate several names with commas to keep issues matching any of them."
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Write the Excel report with xlsxwriter in constant-memory mode (requires xlsxwriter)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Processes used to parse log files of 10 MB and more (default: 1). More only help with idle cores to spare."
     )
     
     args = parser.parse_args()
@@ -180,9 +285,8 @@ def main() -> None:
         print(f"Analyzing Valgrind log: {args.input_file}")
         
         # Initialize components
-        parser = LogParser()
+        parser = LogParser(max_workers=args.jobs)
         classifier = IssueClassifier()
-        reporter = ExcelReporter()
         
         # Parse the log file
         logging.info("Parsing Valgrind log file...")
@@ -211,37 +315,11 @@ def main() -> None:
         classified_issues = classifier.classify_issues(issues)
         
         # Generate Excel report
-        logging.info("Generating Excel report...")
-        try:
-            # Adjust output filename if module filter is applied
-            output_path = args.output
-            if args.module:
-                output_path = args.output.replace('.xlsx', f'_{args.module}.xlsx')
-            
-            reporter.generate_report(classified_issues, output_path)
-            print(f"Excel report generated successfully: {output_path}")
-            
-        except ExcelReportError as e:
-            if args.csv_fallback:
-                print(f"Excel generation failed: {e}")
-                print("Attempting CSV fallback...")
-                csv_output = args.output.replace('.xlsx', '.csv')
-                if args.module:
-                    # Add module name to CSV filename
-                    csv_output = csv_output.replace('.csv', f'_{args.module}.csv')
-                export_to_csv(classified_issues, csv_output)
-                print(f"CSV report generated: {csv_output}")
-            else:
-                raise
+        write_report(classified_issues, args)
         
     except LogParserError as e:
         print(f"Error parsing log file: {e}", file=sys.stderr)
         sys.exit(1)
-    except ExcelReportError as e:
-        print(f"Error generating report: {e}", file=sys.stderr)
-        if not args.csv_fallback:
-            print("Use --csv-fallback option to generate CSV output instead", file=sys.stderr)
-        sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)